@@ -7,6 +7,18 @@ Validates required arguments and provider configuration before debate execution.
 import sys
 import json
 import os
+import shlex
+from typing import Dict
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to stdlib json
+    orjson = None
+
+# Reused across calls instead of the per-call defaults behind json.load/dumps
+_DECODER = json.JSONDecoder()
+# Compact and UTF-8, so both paths write the same bytes as orjson.dumps()
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
 
 # Valid phases and providers
 VALID_PHASES = [
@@ -21,11 +33,54 @@ VALID_PROVIDERS = ["claude", "gpt", "codex", "gemini"]
 
 VALID_ROLES = ["A", "B", "C"]
 
+VALID_PHASES_SET = frozenset(VALID_PHASES)
+VALID_PROVIDERS_SET = frozenset(VALID_PROVIDERS)
+
+
+def parse_command_args(command: str) -> Dict[str, str]:
+    """Tokenize a shell command once and map each --flag to its value.
+
+    Supports both ``--flag value`` and ``--flag=value``. Flags without a
+    value (e.g. ``--is-final``) map to an empty string.
+    """
+    try:
+        tokens = shlex.split(command)
+    except ValueError:
+        # Unbalanced quotes - fall back to plain whitespace split
+        tokens = command.split()
+
+    args = {}
+    for i, token in enumerate(tokens):
+        if not token.startswith("--"):
+            continue
+        flag, sep, value = token.partition("=")
+        if not sep and i + 1 < len(tokens) and not tokens[i + 1].startswith("--"):
+            value = tokens[i + 1]
+        args[flag] = value
+    return args
+
+
+def read_input() -> dict:
+    """Parse hook input from stdin's raw bytes (orjson when available)."""
+    data = sys.stdin.buffer.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return _DECODER.decode(data.decode("utf-8"))
+
+
+def write_output(result: dict) -> None:
+    """Write the hook decision to stdout as a single JSON line."""
+    if orjson is not None:
+        data = orjson.dumps(result)
+    else:
+        data = _ENCODER.encode(result).encode("utf-8")
+    sys.stdout.buffer.write(data + b"\n")
+
 
 def validate_input():
     """Validate hook input from stdin."""
     try:
-        input_data = json.load(sys.stdin)
+        input_data = read_input()
     except json.JSONDecodeError:
         # Not JSON input, skip validation
         sys.exit(0)
@@ -38,49 +93,36 @@ def validate_input():
     if "multi_llm_debater.py" not in command:
         sys.exit(0)
 
+    # Validation-only commands are always valid - skip argument parsing
+    if "--validate-deps" in command or "--validate-api-key" in command:
+        sys.exit(0)
+
+    args = parse_command_args(command)
+
+    # Batch mode reads its phase specs from stdin; the script validates them
+    if "--batch" in args:
+        sys.exit(0)
+
     errors = []
     warnings = []
 
     # Check for required arguments
-    if "--provider" not in command:
+    if "--provider" not in args:
         errors.append("Missing required argument: --provider")
-    else:
-        # Validate provider value
-        for provider in VALID_PROVIDERS:
-            if f"--provider {provider}" in command or f"--provider={provider}" in command:
-                break
-        else:
-            # Check if any valid provider is mentioned
-            provider_found = False
-            for provider in VALID_PROVIDERS:
-                if provider in command:
-                    provider_found = True
-                    break
-            if not provider_found:
-                errors.append(f"Invalid provider. Must be one of: {', '.join(VALID_PROVIDERS)}")
-
-    if "--phase" not in command:
+    elif args["--provider"] not in VALID_PROVIDERS_SET:
+        errors.append(f"Invalid provider. Must be one of: {', '.join(VALID_PROVIDERS)}")
+
+    if "--phase" not in args:
         errors.append("Missing required argument: --phase")
-    else:
-        # Validate phase value
-        phase_valid = False
-        for phase in VALID_PHASES:
-            if phase in command:
-                phase_valid = True
-                break
-        if not phase_valid:
-            errors.append(f"Invalid phase. Must be one of: {', '.join(VALID_PHASES)}")
-
-    if "--topic" not in command:
+    elif args["--phase"] not in VALID_PHASES_SET:
+        errors.append(f"Invalid phase. Must be one of: {', '.join(VALID_PHASES)}")
+
+    if "--topic" not in args:
         errors.append("Missing required argument: --topic")
 
-    if "--role" not in command:
+    if "--role" not in args:
         warnings.append("Consider specifying --role (A, B, or C) for context isolation")
 
-    # Check for validation-only commands (these are always valid)
-    if "--validate-deps" in command or "--validate-api-key" in command:
-        sys.exit(0)
-
     # Output result
     result = {
         "decision": "block" if errors else "allow",
@@ -93,7 +135,7 @@ def validate_input():
         # Allow but with informational message (printed to stderr)
         print(f"Warnings: {'; '.join(warnings)}", file=sys.stderr)
 
-    print(json.dumps(result))
+    write_output(result)
 
 
 if __name__ == "__main__":
@@ -6,6 +6,18 @@ Validates JSON output structure and quality after debate execution.
 
 import sys
 import json
+import shlex
+from typing import Optional, Union
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to stdlib json
+    orjson = None
+
+# Reused across calls instead of the per-call defaults behind json.load/dumps
+_DECODER = json.JSONDecoder()
+# Compact and UTF-8, so both paths write the same bytes as orjson.dumps()
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
 
 
 # Expected fields per phase
@@ -18,10 +30,83 @@ EXPECTED_FIELDS = {
 }
 
 
+def extract_phase(command: str) -> Optional[str]:
+    """Return the value of --phase from the command, if any."""
+    try:
+        tokens = shlex.split(command)
+    except ValueError:
+        # Unbalanced quotes - fall back to plain whitespace split
+        tokens = command.split()
+
+    for i, token in enumerate(tokens):
+        if token == "--phase":
+            return tokens[i + 1] if i + 1 < len(tokens) else None
+        if token.startswith("--phase="):
+            return token[len("--phase="):]
+    return None
+
+
+def parse_json(data):
+    """Parse JSON text or UTF-8 bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return _DECODER.decode(data)
+
+
+def read_input() -> dict:
+    """Parse hook input from stdin's raw bytes."""
+    return parse_json(sys.stdin.buffer.read())
+
+
+def write_output(result: dict) -> None:
+    """Write the hook decision to stdout as a single JSON line."""
+    if orjson is not None:
+        data = orjson.dumps(result)
+    else:
+        data = _ENCODER.encode(result).encode("utf-8")
+    sys.stdout.buffer.write(data + b"\n")
+
+
+def extract_json(stdout: str) -> Optional[Union[dict, list]]:
+    """Find and parse the JSON payload embedded in debater output.
+
+    Tries, in order: the whole output, a ```json fenced block, the first
+    ``` fenced block, and the span from the first '{' to the last '}'.
+    Each candidate is located with str.find/rfind in a single pass.
+    """
+    candidates = [stdout]
+
+    start = stdout.find("```json")
+    if start >= 0:
+        end = stdout.find("```", start + 7)
+        if end >= 0:
+            candidates.append(stdout[start + 7:end])
+
+    start = stdout.find("```")
+    if start >= 0:
+        end = stdout.find("```", start + 3)
+        if end >= 0:
+            candidates.append(stdout[start + 3:end])
+
+    start = stdout.find("{")
+    end = stdout.rfind("}")
+    if 0 <= start < end:
+        candidates.append(stdout[start:end + 1])
+
+    for candidate in candidates:
+        try:
+            return parse_json(candidate)
+        except json.JSONDecodeError:
+            continue
+    return None
+
+
 def validate_output():
     """Validate hook output from stdin."""
     try:
-        input_data = json.load(sys.stdin)
+        input_data = read_input()
     except json.JSONDecodeError:
         # Not JSON input, skip validation
         sys.exit(0)
@@ -44,37 +129,23 @@ def validate_output():
     warnings = []
 
     # Try to extract JSON from output
-    json_result = None
-    try:
-        # Try direct parse
-        json_result = json.loads(stdout.strip())
-    except json.JSONDecodeError:
-        # Try to find JSON in output
-        import re
-        json_patterns = [
-            r'```json\s*([\s\S]*?)\s*```',
-            r'```\s*([\s\S]*?)\s*```',
-            r'(\{[\s\S]*\})'
-        ]
-        for pattern in json_patterns:
-            match = re.search(pattern, stdout)
-            if match:
-                try:
-                    json_result = json.loads(match.group(1))
-                    break
-                except json.JSONDecodeError:
-                    continue
+    json_result = extract_json(stdout)
 
     if json_result is None:
         warnings.append("Output does not contain valid JSON - may need manual review")
+    elif isinstance(json_result, list):
+        # --batch output: one result object per phase spec
+        for i, entry in enumerate(json_result):
+            if isinstance(entry, dict) and entry.get("success") is False:
+                warnings.append(f"Batch entry {i} reported an error: {entry.get('error', 'Unknown')}")
     else:
         # Check for expected fields based on phase
-        for phase, expected in EXPECTED_FIELDS.items():
-            if phase in command:
-                missing_fields = [f for f in expected if f not in json_result]
-                if missing_fields:
-                    warnings.append(f"Missing expected fields for {phase}: {', '.join(missing_fields)}")
-                break
+        phase = extract_phase(command)
+        expected = EXPECTED_FIELDS.get(phase)
+        if expected:
+            missing_fields = [f for f in expected if f not in json_result]
+            if missing_fields:
+                warnings.append(f"Missing expected fields for {phase}: {', '.join(missing_fields)}")
 
         # Check for error indicators
         if json_result.get("error") or json_result.get("status") == "error":
@@ -96,7 +167,7 @@ def validate_output():
         # Print warnings to stderr for visibility
         print(f"Debate output warnings:\n" + "\n".join(f"  - {w}" for w in warnings), file=sys.stderr)
 
-    print(json.dumps(result))
+    write_output(result)
 
 
 if __name__ == "__main__":
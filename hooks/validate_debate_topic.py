@@ -22,15 +22,29 @@ import sys
 import json
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, NamedTuple, Optional
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to stdlib json
+    orjson = None
+
+# Reused across calls instead of the per-call defaults behind json.load/dumps
+_DECODER = json.JSONDecoder()
+# Compact and UTF-8, so both paths write the same bytes as orjson.dumps()
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_ANALYSIS_ENCODER = json.JSONEncoder(ensure_ascii=False)
 
 
 # =============================================================================
 # DIMENSION ANALYSIS (forge-analyzer pattern)
 # =============================================================================
 
-@dataclass
-class DimensionScore:
+# slots=True needs Python 3.10+; hooks may run under an older system python3
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class DimensionScore(NamedTuple):
     """Score for a single analysis dimension."""
     name: str
     score: float  # 0.0 ~ 1.0
@@ -38,7 +52,7 @@ class DimensionScore:
     suggestion: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TopicAnalysis:
     """Complete topic analysis result."""
     topic: str
@@ -97,33 +111,104 @@ COMPARISON_PATTERNS = [
     r'어떤\s*(것|방법|접근)',
 ]
 
+# Precompiled at import as single alternations so each check is one C-level scan
+_TECH_RE = re.compile('|'.join(re.escape(kw.lower()) for kw in TECHNICAL_KEYWORDS))
+_COMPARISON_COMBINED = re.compile(
+    '|'.join(f'(?:{p})' for p in COMPARISON_PATTERNS), re.IGNORECASE
+)
 
-def is_technical_topic(topic: str) -> bool:
+
+def is_technical_topic(topic: str, topic_lower: Optional[str] = None) -> bool:
     """Check if topic is technical/methodology related."""
-    topic_lower = topic.lower()
+    if topic_lower is None:
+        topic_lower = topic.lower()
+
+    # Check for technical keywords, then comparison patterns
+    return bool(_TECH_RE.search(topic_lower) or _COMPARISON_COMBINED.search(topic))
+
+
+# =============================================================================
+# DIMENSION PATTERNS
+# =============================================================================
+
+# Vague pronouns (still problematic)
+VAGUE_PATTERNS = [
+    (r'\b(이것|그것|저것)\b', "지시대명사가 모호합니다"),
+    (r'^(이게|그게|저게)\s', "대상이 불명확합니다"),
+]
+
+# Pure factual questions (still problematic)
+FACTUAL_PATTERNS = [
+    (r'^언제\s', "시점 확인 질문입니다"),
+    (r'^누가\s', "사실 확인 질문입니다"),
+]
+
+# One-sided (still problematic but less strict for technical)
+OBVIOUS_PATTERNS = [
+    (r'(당연히|물론|명백히)\s', "결론이 전제되어 있습니다"),
+]
+
+# Pure hypotheticals are less actionable
+HYPOTHETICAL_PATTERNS = [
+    (r'만약.*없었다면', "가정적/반사실적 주제입니다"),
+]
+
+# Decision-oriented keywords boost actionability
+ACTION_KEYWORDS = [
+    '도입', '적용', '사용', '선택', '결정', '구현', '설계', '채택',
+    'implement', 'use', 'adopt', 'choose', 'build', 'design',
+    'should', 'better', 'best', 'optimal', 'recommend',
+]
+
+# Topics shorter than this score 0.2 on clarity (below min_dimension)
+MIN_TOPIC_LENGTH = 4
+
+
+def _compile_reason_patterns(patterns):
+    """Fold (pattern, reason) pairs into one regex with a named group per reason.
+
+    Patterns within one list must not overlap, since finditer reports
+    non-overlapping matches only.
+    """
+    regex = re.compile('|'.join(f'(?P<r{i}>{p})' for i, (p, _) in enumerate(patterns)))
+    reasons = {f'r{i}': reason for i, (_, reason) in enumerate(patterns)}
+    return regex, reasons
 
-    # Check for technical keywords
-    for kw in TECHNICAL_KEYWORDS:
-        if kw.lower() in topic_lower:
-            return True
 
-    # Check for comparison patterns
-    for pattern in COMPARISON_PATTERNS:
-        if re.search(pattern, topic, re.IGNORECASE):
-            return True
+def _matched_reasons(regex, reasons, topic: str) -> List[str]:
+    """Return reasons whose pattern matched, in declaration order."""
+    found = {m.lastgroup for m in regex.finditer(topic)}
+    return [reason for name, reason in reasons.items() if name in found]
 
-    return False
+
+_VAGUE_RE, _VAGUE_REASONS = _compile_reason_patterns(VAGUE_PATTERNS)
+_FACTUAL_RE, _FACTUAL_REASONS = _compile_reason_patterns(FACTUAL_PATTERNS)
+_OBVIOUS_RE, _OBVIOUS_REASONS = _compile_reason_patterns(OBVIOUS_PATTERNS)
+_HYPOTHETICAL_RE, _HYPOTHETICAL_REASONS = _compile_reason_patterns(HYPOTHETICAL_PATTERNS)
+_SPECIFIC_COMPARISON_RE = re.compile(r'\bvs\.?\b|versus|\bor\b', re.IGNORECASE)
+_WORD_RE = re.compile(r'[가-힣a-zA-Z0-9]+')
+_ACTION_RE = re.compile('|'.join(re.escape(kw) for kw in ACTION_KEYWORDS))
 
 
 # =============================================================================
 # DIMENSION ANALYZERS
 # =============================================================================
 
-def analyze_clarity(topic: str, is_technical: bool) -> DimensionScore:
+def analyze_dimensions(
+    topic: str,
+    topic_lower: str,
+    is_technical: bool,
+    has_comparison: bool,
+) -> List[DimensionScore]:
     """
-    Dimension 1: Clarity (명확성)
-    Is the topic clear and understandable?
+    Score all four dimensions in a single walk over the topic.
+
+    Returns [clarity, debatability, specificity, actionability].
     """
+    # -------------------------------------------------------------------------
+    # Dimension 1: Clarity (명확성)
+    # Is the topic clear and understandable?
+    # -------------------------------------------------------------------------
     score = 1.0
     reasons = []
     suggestion = None
@@ -132,7 +217,7 @@ def analyze_clarity(topic: str, is_technical: bool) -> DimensionScore:
     # But single keywords are still too vague
     topic_len = len(topic)
 
-    if topic_len < 4:
+    if topic_len < MIN_TOPIC_LENGTH:
         # Very short - single word/acronym without context
         score = 0.2
         reasons.append("주제가 너무 짧습니다")
@@ -144,111 +229,90 @@ def analyze_clarity(topic: str, is_technical: bool) -> DimensionScore:
         suggestion = "프로젝트 맥락이나 비교 대상을 추가해주세요"
 
     # Vague pronouns (still problematic)
-    vague_patterns = [
-        (r'\b(이것|그것|저것)\b', "지시대명사가 모호합니다"),
-        (r'^(이게|그게|저게)\s', "대상이 불명확합니다"),
-    ]
-
-    for pattern, reason in vague_patterns:
-        if re.search(pattern, topic):
-            score = min(score, 0.5)
-            reasons.append(reason)
-            suggestion = "구체적인 기술/방법론 이름을 명시해주세요"
-
-    return DimensionScore(
+    matched = _matched_reasons(_VAGUE_RE, _VAGUE_REASONS, topic)
+    if matched:
+        score = min(score, 0.5)
+        reasons.extend(matched)
+        suggestion = "구체적인 기술/방법론 이름을 명시해주세요"
+
+    clarity = DimensionScore(
         name="clarity",
         score=score,
         reason="; ".join(reasons) if reasons else "주제가 명확합니다",
         suggestion=suggestion
     )
 
-
-def analyze_debatability(topic: str, is_technical: bool) -> DimensionScore:
-    """
-    Dimension 2: Debatability (토론가능성)
-    Can this topic support multiple valid viewpoints?
-    """
+    # -------------------------------------------------------------------------
+    # Dimension 2: Debatability (토론가능성)
+    # Can this topic support multiple valid viewpoints?
+    # -------------------------------------------------------------------------
     score = 1.0
     reasons = []
     suggestion = None
 
     # For technical topics, comparisons are inherently debatable
-    if is_technical:
-        for pattern in COMPARISON_PATTERNS:
-            if re.search(pattern, topic, re.IGNORECASE):
-                score = min(score + 0.2, 1.0)  # Bonus for comparison format
-                break
+    if is_technical and has_comparison:
+        score = min(score + 0.2, 1.0)  # Bonus for comparison format
 
     # Pure factual questions (still problematic)
-    factual_patterns = [
-        (r'^언제\s', "시점 확인 질문입니다"),
-        (r'^누가\s', "사실 확인 질문입니다"),
-    ]
-
-    for pattern, reason in factual_patterns:
-        if re.search(pattern, topic):
-            score = min(score, 0.5)
-            reasons.append(reason)
-            suggestion = "의사결정이나 비교 형태로 재구성해주세요"
+    matched = _matched_reasons(_FACTUAL_RE, _FACTUAL_REASONS, topic)
+    if matched:
+        score = min(score, 0.5)
+        reasons.extend(matched)
+        suggestion = "의사결정이나 비교 형태로 재구성해주세요"
 
     # One-sided (still problematic but less strict for technical)
     if not is_technical:
-        obvious_patterns = [
-            (r'(당연히|물론|명백히)\s', "결론이 전제되어 있습니다"),
-        ]
-        for pattern, reason in obvious_patterns:
-            if re.search(pattern, topic):
-                score = min(score, 0.7)
-                reasons.append(reason)
-
-    return DimensionScore(
+        matched = _matched_reasons(_OBVIOUS_RE, _OBVIOUS_REASONS, topic)
+        if matched:
+            score = min(score, 0.7)
+            reasons.extend(matched)
+
+    debatability = DimensionScore(
         name="debatability",
         score=score,
         reason="; ".join(reasons) if reasons else "토론 가능한 주제입니다",
         suggestion=suggestion
     )
 
-
-def analyze_specificity(topic: str, is_technical: bool) -> DimensionScore:
-    """
-    Dimension 3: Specificity (구체성)
-    Is the topic specific enough for meaningful debate?
-    """
+    # -------------------------------------------------------------------------
+    # Dimension 3: Specificity (구체성)
+    # Is the topic specific enough for meaningful debate?
+    # -------------------------------------------------------------------------
     score = 1.0
     reasons = []
     suggestion = None
 
     # Word count - more lenient for technical topics
-    words = re.findall(r'[가-힣a-zA-Z0-9]+', topic)
+    # (counted without building a list of word strings)
+    word_count = sum(1 for _ in _WORD_RE.finditer(topic))
     min_words = 2 if is_technical else 3
 
-    if len(words) < min_words:
+    if word_count < min_words:
         score = min(score, 0.5)
         reasons.append("키워드가 부족합니다")
         suggestion = "비교 대상이나 프로젝트 맥락을 추가해주세요"
-    elif len(words) > 40:
+    elif word_count > 40:
         score = min(score, 0.7)
         reasons.append("주제가 너무 복잡합니다")
         suggestion = "핵심 의사결정 하나에 집중해주세요"
 
     # Technical topics with clear comparisons get bonus
-    if is_technical and re.search(r'\bvs\.?\b|versus|\bor\b', topic, re.IGNORECASE):
+    if is_technical and _SPECIFIC_COMPARISON_RE.search(topic):
         score = min(score + 0.1, 1.0)
 
-    return DimensionScore(
+    specificity = DimensionScore(
         name="specificity",
         score=score,
         reason="; ".join(reasons) if reasons else "적절한 구체성입니다",
         suggestion=suggestion
     )
 
-
-def analyze_actionability(topic: str, is_technical: bool) -> DimensionScore:
-    """
-    Dimension 4: Actionability (실행가능성)
-    Can this debate lead to actionable conclusions?
-    (Replaces "Evidence Potential" - more relevant for technical debates)
-    """
+    # -------------------------------------------------------------------------
+    # Dimension 4: Actionability (실행가능성)
+    # Can this debate lead to actionable conclusions?
+    # (Replaces "Evidence Potential" - more relevant for technical debates)
+    # -------------------------------------------------------------------------
     score = 1.0
     reasons = []
     suggestion = None
@@ -258,32 +322,25 @@ def analyze_actionability(topic: str, is_technical: bool) -> DimensionScore:
         score = min(score + 0.2, 1.0)
 
     # Decision-oriented keywords boost score
-    action_keywords = [
-        '도입', '적용', '사용', '선택', '결정', '구현', '설계', '채택',
-        'implement', 'use', 'adopt', 'choose', 'build', 'design',
-        'should', 'better', 'best', 'optimal', 'recommend',
-    ]
-    if any(kw in topic.lower() for kw in action_keywords):
+    if _ACTION_RE.search(topic_lower):
         score = min(score + 0.1, 1.0)
 
     # Pure hypotheticals are less actionable
-    hypothetical_patterns = [
-        (r'만약.*없었다면', "가정적/반사실적 주제입니다"),
-    ]
+    matched = _matched_reasons(_HYPOTHETICAL_RE, _HYPOTHETICAL_REASONS, topic)
+    if matched:
+        score = min(score, 0.6)
+        reasons.extend(matched)
+        suggestion = "현재 의사결정에 초점을 맞춰주세요"
 
-    for pattern, reason in hypothetical_patterns:
-        if re.search(pattern, topic):
-            score = min(score, 0.6)
-            reasons.append(reason)
-            suggestion = "현재 의사결정에 초점을 맞춰주세요"
-
-    return DimensionScore(
+    actionability = DimensionScore(
         name="actionability",
         score=score,
         reason="; ".join(reasons) if reasons else "실행 가능한 결론 도출이 가능합니다",
         suggestion=suggestion
     )
 
+    return [clarity, debatability, specificity, actionability]
+
 
 # =============================================================================
 # MAIN ANALYSIS
@@ -294,14 +351,13 @@ def analyze_topic(topic: str) -> TopicAnalysis:
     Perform full dimension analysis on debate topic.
     Returns TopicAnalysis with scores and suggestions.
     """
-    is_technical = is_technical_topic(topic)
+    topic_lower = topic.lower()
 
-    dimensions = [
-        analyze_clarity(topic, is_technical),
-        analyze_debatability(topic, is_technical),
-        analyze_specificity(topic, is_technical),
-        analyze_actionability(topic, is_technical),
-    ]
+    is_technical = is_technical_topic(topic, topic_lower)
+    # Debatability scoring also needs the comparison signal on its own
+    has_comparison = bool(_COMPARISON_COMBINED.search(topic))
+
+    dimensions = analyze_dimensions(topic, topic_lower, is_technical, has_comparison)
 
     # Calculate overall score (weighted average)
     # For technical topics, actionability matters more
@@ -332,6 +388,23 @@ def analyze_topic(topic: str) -> TopicAnalysis:
 # HOOK ENTRY POINT - Pattern 2: Block + Agent Delegation
 # =============================================================================
 
+def read_input() -> dict:
+    """Parse hook input from stdin's raw bytes (orjson when available)."""
+    data = sys.stdin.buffer.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return _DECODER.decode(data.decode("utf-8"))
+
+
+def write_output(result: dict) -> None:
+    """Write the hook decision to stdout as a single JSON line."""
+    if orjson is not None:
+        data = orjson.dumps(result)
+    else:
+        data = _ENCODER.encode(result).encode("utf-8")
+    sys.stdout.buffer.write(data + b"\n")
+
+
 def validate_input():
     """
     Main hook entry point - validates debate topic quality.
@@ -341,7 +414,7 @@ def validate_input():
     - If topic quality is bad: block + instruct Claude to use /clarify-topic command
     """
     try:
-        input_data = json.load(sys.stdin)
+        input_data = read_input()
     except json.JSONDecodeError:
         sys.exit(0)
 
@@ -355,18 +428,23 @@ def validate_input():
     # Only validate debate skills
     if skill_name not in ["debate", "debate-multiverse", "philosopher:debate", "philosopher:debate-multiverse"]:
         # Not a debate skill - allow
-        print(json.dumps({"decision": "allow", "reason": None}))
+        write_output({"decision": "allow", "reason": None})
         sys.exit(0)
 
     # Extract topic from args
     topic = skill_args.strip() if skill_args else ""
 
-    # Remove flags from topic
-    topic = re.sub(r'\s+--\S+.*$', '', topic).strip()
+    # Remove flags from topic (everything from the first " --flag" on)
+    idx = topic.find(' --')
+    while idx >= 0 and (idx + 3 >= len(topic) or topic[idx + 3].isspace()):
+        idx = topic.find(' --', idx + 1)
+    if idx >= 0:
+        topic = topic[:idx]
+    topic = topic.strip()
     topic = topic.strip('"\'')
 
     if not topic:
-        print(json.dumps({
+        write_output({
             "decision": "block",
             "reason": """토론 주제가 제공되지 않았습니다.
 
@@ -378,7 +456,7 @@ def validate_input():
 - /debate "TDD 적용 범위 결정"
 
 MANDATORY: 사용자에게 토론 주제를 입력받으세요."""
-        }))
+        })
         sys.exit(0)
 
     # Perform dimension analysis
@@ -387,20 +465,21 @@ MANDATORY: 사용자에게 토론 주제를 입력받으세요."""
     if analysis.is_valid:
         # Topic is good - allow with info
         topic_type = "기술/방법론" if analysis.is_technical else "일반"
-        print(f"[Topic Quality] Score: {analysis.overall_score:.2f} ✓ ({topic_type})", file=sys.stderr)
-        for d in analysis.dimensions:
-            print(f"  - {d.name}: {d.score:.2f}", file=sys.stderr)
+        # Single write instead of one print per dimension
+        lines = [f"[Topic Quality] Score: {analysis.overall_score:.2f} ✓ ({topic_type})"]
+        lines.extend(f"  - {d.name}: {d.score:.2f}" for d in analysis.dimensions)
+        sys.stderr.write("\n".join(lines) + "\n")
 
-        print(json.dumps({"decision": "allow", "reason": None}))
+        write_output({"decision": "allow", "reason": None})
     else:
         # Topic needs improvement - BLOCK + DELEGATE TO AGENT
-        analysis_json = json.dumps({
+        analysis_json = _ANALYSIS_ENCODER.encode({
             "topic": analysis.topic,
             "overall_score": analysis.overall_score,
             "is_technical": analysis.is_technical,
             "weakest_dimension": analysis.weakest_dimension,
             "dimensions": {d.name: {"score": d.score, "reason": d.reason} for d in analysis.dimensions}
-        }, ensure_ascii=False)
+        })
 
         reason = f"""토론 주제 명확화가 필요합니다.
 
@@ -420,10 +499,10 @@ MANDATORY: /clarify-topic 커맨드를 사용하여 주제를 명확화하세요
 커맨드가 프로젝트 맥락, 비교 대상, 의사결정 범위 등을 질문하여 명확화합니다.
 명확화된 주제로 /debate 스킬을 다시 호출하세요."""
 
-        print(json.dumps({
+        write_output({
             "decision": "block",
             "reason": reason
-        }))
+        })
 
 
 if __name__ == "__main__":
@@ -6,7 +6,7 @@ Complete debate system with proper context isolation, phased execution,
 and production-grade robustness features.
 
 v3 Improvements:
-- Timeout handling with asyncio.wait_for
+- Timeout handling with a per-phase deadline
 - Retry logic with exponential backoff
 - Dependency validation
 - Robust JSON parsing with recovery
@@ -33,21 +33,97 @@ Usage:
     python multi_llm_debater.py --provider codex --role B --phase round_claim_attack \
         --topic "AI regulation" --own-research '{...}' --visible-statements '{...}'
 
+    # Batch: run several phases concurrently in one process
+    echo '[{"provider": "claude", "role": "A", "phase": "initial_research",
+            "topic": "AI regulation", "viewpoint": "..."}, ...]' \
+        | python multi_llm_debater.py --batch
+
     # Validation commands
     python multi_llm_debater.py --validate-deps
     python multi_llm_debater.py --validate-api-key claude
 """
 
 import argparse
-import asyncio
+import atexit
+import importlib.util
 import json
 import os
+import random
 import re
+import string
 import sys
 import time
-from dataclasses import dataclass, asdict
-from datetime import datetime
-from typing import Optional, Dict, Any, List, Callable
+from dataclasses import dataclass, field, fields
+from typing import Optional, Dict, Any, List, Callable, Literal
+
+
+def _lazy_import(name: str):
+    """Return module `name`, deferring its execution until first attribute use."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# Validation commands (--validate-deps, --validate-api-key) never touch these,
+# so each short-lived CLI invocation skips their import cost
+asyncio = _lazy_import("asyncio")
+hashlib = _lazy_import("hashlib")
+datetime = _lazy_import("datetime")
+
+# Optional: faster event loop when installed (not available on Windows)
+uvloop = _lazy_import("uvloop") if importlib.util.find_spec("uvloop") else None
+
+try:
+    import orjson
+except ImportError:  # optional: faster parsing/serialization when available
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+else:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def write_result(obj: Any) -> None:
+    """Write a result document to stdout as indented JSON."""
+    if orjson is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(
+            orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS) + b"\n"
+        )
+    else:
+        # Escape non-ASCII only when stdout can't encode it
+        ensure_ascii = (sys.stdout.encoding or "").lower().replace("-", "") != "utf8"
+        sys.stdout.write(
+            json.dumps(obj, ensure_ascii=ensure_ascii, indent=2, separators=(",", ": ")) + "\n"
+        )
+
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters get plain classes
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_FIELD_NAMES: Dict[type, tuple] = {}
+
+
+def to_dict(obj: Any) -> Dict[str, Any]:
+    """Shallow dataclasses.asdict() for the flat result dataclasses (no deep copy)."""
+    cls = type(obj)
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(cls))
+    return {name: getattr(obj, name) for name in names}
 
 # =============================================================================
 # DEPENDENCY VALIDATION
@@ -104,35 +180,62 @@ def validate_api_keys(provider: str) -> Dict[str, Any]:
     }
 
 
-# Validate dependencies at import time
-_dep_check = validate_dependencies()
-if not _dep_check["valid"]:
-    print(json.dumps({
-        "success": False,
-        "error": "Dependency validation failed",
-        "details": _dep_check["errors"]
-    }))
-    sys.exit(1)
+# u-llm-sdk is imported on first use so that validation commands and argument
+# errors don't pay for it; these names are bound by load_sdk()
+LLM = LLMConfig = None
+Provider = ModelTier = AutoApproval = ReasoningLevel = None
+
 
-# Now safe to import
-from u_llm_sdk import LLM, LLMConfig
-from llm_types import Provider, ModelTier, AutoApproval, ReasoningLevel
+def load_sdk() -> None:
+    """Import u-llm-sdk once, exiting with a JSON error if it is missing."""
+    global LLM, LLMConfig, Provider, ModelTier, AutoApproval, ReasoningLevel
+    if LLM is not None:
+        return
+
+    dep_check = validate_dependencies()
+    if not dep_check["valid"]:
+        write_result({
+            "success": False,
+            "error": "Dependency validation failed",
+            "details": dep_check["errors"]
+        })
+        sys.exit(1)
+
+    from u_llm_sdk import LLM, LLMConfig
+    from llm_types import Provider, ModelTier, AutoApproval, ReasoningLevel
+
+    PROVIDER_MAP.update({
+        "claude": Provider.CLAUDE,
+        "gpt": Provider.CODEX,
+        "codex": Provider.CODEX,
+        "gemini": Provider.GEMINI,
+    })
 
 
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 
-@dataclass
+@dataclass(**_SLOTS)
 class RetryConfig:
     """Configuration for retry behavior."""
     max_attempts: int = 3
     base_delay: float = 1.0
     max_delay: float = 30.0
     exponential_base: float = 2.0
+    # "full": uniform in [0, delay]; "equal": delay/2 + uniform in [0, delay/2]
+    jitter: Literal["none", "full", "equal"] = "full"
+    delays: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Backoff before retry N+1 is delays[N - 1]; computed once per config
+        self.delays = tuple(
+            min(self.base_delay * (self.exponential_base ** i), self.max_delay)
+            for i in range(self.max_attempts)
+        )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TimeoutConfig:
     """Timeout configuration per phase."""
     initial_research: float = 180.0  # WebSearch included
@@ -140,27 +243,56 @@ class TimeoutConfig:
     round_claim_attack: float = 90.0
     prep_defense: float = 180.0  # WebSearch included
     round_defense: float = 90.0
+    _table: Dict[str, float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Phase -> timeout table so get() is a plain dict lookup
+        self._table = {f.name: getattr(self, f.name) for f in fields(self) if f.init}
 
     def get(self, phase: str) -> float:
-        return getattr(self, phase, 90.0)
+        return self._table.get(phase, 90.0)
 
 
-PROVIDER_MAP = {
-    "claude": Provider.CLAUDE,
-    "gpt": Provider.CODEX,
-    "codex": Provider.CODEX,
-    "gemini": Provider.GEMINI,
-}
+def default_cache_directory() -> str:
+    """Per-user cache directory: $DEBATE_CACHE_DIR, else the XDG cache home.
+
+    Never the current directory, which is the user's project.
+    """
+    override = os.environ.get("DEBATE_CACHE_DIR")
+    if override:
+        return override
+    cache_home = os.environ.get("XDG_CACHE_HOME", "")
+    if not os.path.isabs(cache_home):  # the XDG spec says to ignore relative paths
+        cache_home = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "philosopher")
+
+
+@dataclass(**_SLOTS)
+class CacheConfig:
+    """On-disk cache for expensive, input-deterministic research phases."""
+    enabled: bool = True
+    directory: str = field(default_factory=default_cache_directory)
+    ttl: float = 24 * 3600.0  # Research goes stale; re-run after a day
+
+
+PROVIDER_MAP: Dict[str, "Provider"] = {}  # filled by load_sdk()
+
+PHASES = ("initial_research", "round_claim", "round_claim_attack", "prep_defense", "round_defense")
+WEB_SEARCH_PHASES = frozenset({"initial_research", "prep_defense"})
+
+# Claude is assumed always available; only these providers are probed
+HEALTH_CHECKED_PROVIDERS = frozenset({"gemini", "codex"})
 
 RETRY_CONFIG = RetryConfig()
 TIMEOUT_CONFIG = TimeoutConfig()
+CACHE_CONFIG = CacheConfig()
 
 
 # =============================================================================
 # FALLBACK CONFIGURATION
 # =============================================================================
 
-@dataclass
+@dataclass(**_SLOTS)
 class FallbackConfig:
     """Configuration for automatic provider fallback."""
     enabled: bool = True
@@ -168,7 +300,7 @@ class FallbackConfig:
     health_check_timeout: float = 15.0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProviderStatus:
     """Result of provider availability check."""
     provider: str
@@ -178,7 +310,7 @@ class ProviderStatus:
     error_type: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FallbackEvent:
     """Record of a fallback occurrence."""
     phase: str
@@ -190,7 +322,25 @@ class FallbackEvent:
     recovery_time_ms: Optional[float] = None
 
 
+@dataclass(**_SLOTS)
+class BreakerConfig:
+    """Configuration for the per-provider circuit breaker."""
+    failure_threshold: int = 3  # Consecutive recoverable failures before opening
+    cooldown: float = 30.0  # Seconds to stay open before letting a probe through
+
+
+@dataclass(**_SLOTS)
+class HedgeConfig:
+    """Configuration for hedging a slow primary call with the fallback provider."""
+    enabled: bool = False
+    hedge_after: float = 30.0  # Seconds without a primary response before hedging
+    # Web-search research is too expensive to run twice
+    phases: frozenset = frozenset(PHASES) - {"initial_research"}
+
+
 FALLBACK_CONFIG = FallbackConfig()
+BREAKER_CONFIG = BreakerConfig()
+HEDGE_CONFIG = HedgeConfig()
 
 
 # =============================================================================
@@ -212,23 +362,64 @@ HARD_FAILURE_PATTERNS = {
 }
 
 
+def _compile_error_patterns(categories: Dict[str, List[str]]) -> List[tuple]:
+    """Collapse each category's literal patterns into one alternation regex."""
+    return [
+        (error_type, re.compile("|".join(map(re.escape, patterns))))
+        for error_type, patterns in categories.items()
+    ]
+
+
+_FALLBACK_RES = _compile_error_patterns(FALLBACK_ERROR_PATTERNS)
+_HARD_RES = _compile_error_patterns(HARD_FAILURE_PATTERNS)
+
+# Every pattern of every category; one scan rules out unrecognised errors
+_ANY_ERROR_RE = re.compile("|".join(
+    re.escape(p)
+    for categories in (FALLBACK_ERROR_PATTERNS, HARD_FAILURE_PATTERNS)
+    for patterns in categories.values()
+    for p in patterns
+))
+
+
 def classify_error(error_message: str) -> str:
     """Classify error message into error type for fallback decision."""
     error_lower = error_message.lower()
+    if not _ANY_ERROR_RE.search(error_lower):
+        return "unknown"
 
     # Check fallback-triggering patterns first
-    for error_type, patterns in FALLBACK_ERROR_PATTERNS.items():
-        if any(p in error_lower for p in patterns):
+    for error_type, regex in _FALLBACK_RES:
+        if regex.search(error_lower):
             return error_type
 
     # Check hard failure patterns
-    for error_type, patterns in HARD_FAILURE_PATTERNS.items():
-        if any(p in error_lower for p in patterns):
+    for error_type, regex in _HARD_RES:
+        if regex.search(error_lower):
             return error_type
 
     return "unknown"
 
 
+def classify_exception(error: BaseException) -> str:
+    """classify_error() for an exception, memoized on the exception itself.
+
+    A failed attempt is classified where it is raised (for the circuit
+    breaker); the phase result then reuses that category.
+    """
+    category = getattr(error, "error_category", None)
+    if category is None:
+        if isinstance(error, asyncio.TimeoutError):
+            category = "timeout"
+        else:
+            category = classify_error(str(error))
+        try:
+            error.error_category = category
+        except AttributeError:
+            pass
+    return category
+
+
 def should_fallback(result: dict) -> bool:
     """Determine if error should trigger fallback to alternative provider."""
     if result.get("success"):
@@ -237,33 +428,127 @@ def should_fallback(result: dict) -> bool:
     error = result.get("error", "") or ""
     error_type = result.get("error_type", "")
 
-    # Timeout always triggers fallback
-    if error_type == "timeout":
+    # Timeout and an open circuit always trigger fallback
+    if error_type in ("timeout", "CircuitOpenError"):
         return True
 
-    # Classify and check
-    classified = classify_error(error)
+    # Prefer the category run_phase attached; classify legacy results by text
+    classified = result.get("error_category") or classify_error(error)
     return classified in FALLBACK_ERROR_PATTERNS
 
 
+# =============================================================================
+# LLM CLIENT POOL
+# =============================================================================
+
+_LLM_POOL: Dict[tuple, "LLM"] = {}
+_LLM_POOL_LOCKS: Dict[tuple, "asyncio.Lock"] = {}
+
+
+def _llm_key(options: Dict[str, Any]) -> tuple:
+    return tuple(sorted(options.items()))
+
+
+async def get_llm(**options) -> "LLM":
+    """Return an open LLM client for the given LLMConfig options.
+
+    Clients are opened once per distinct configuration and reused for the
+    rest of the process, so retries and repeated calls skip connection setup.
+    """
+    key = _llm_key(options)
+    llm = _LLM_POOL.get(key)
+    if llm is not None:
+        return llm
+
+    lock = _LLM_POOL_LOCKS.setdefault(key, asyncio.Lock())
+    async with lock:
+        llm = _LLM_POOL.get(key)
+        if llm is None:
+            llm = await LLM(LLMConfig(**options)).__aenter__()
+            _LLM_POOL[key] = llm
+    return llm
+
+
+async def discard_llm(**options) -> None:
+    """Close and drop a pooled client, e.g. after it raised mid-request."""
+    llm = _LLM_POOL.pop(_llm_key(options), None)
+    if llm is not None:
+        try:
+            await llm.__aexit__(None, None, None)
+        except Exception:
+            pass
+
+
+async def close_llm_pool() -> None:
+    """Close every pooled client."""
+    while _LLM_POOL:
+        _, llm = _LLM_POOL.popitem()
+        try:
+            await llm.__aexit__(None, None, None)
+        except Exception:
+            pass
+
+
 # =============================================================================
 # PROVIDER HEALTH CHECK
 # =============================================================================
 
 AVAILABILITY_TEST_PROMPT = "Reply with only the word 'OK'."
 
+# Successful probes are trusted for this long before re-checking a provider
+HEALTH_CACHE_TTL = 60.0
+_HEALTH_CACHE: Dict[str, tuple] = {}  # provider name -> (checked_at, ProviderStatus)
+
+# Shared on disk so sibling debater subprocesses reuse one probe per provider
+HEALTH_CACHE_CONFIG = CacheConfig(ttl=HEALTH_CACHE_TTL)
+
+
+def _health_cache_key(provider_name: str) -> str:
+    return f"health-{provider_name}-low"  # probes always use ModelTier.LOW
+
+
+def load_cached_health(provider_name: str) -> Optional[ProviderStatus]:
+    """Return a recent successful probe from this process or a sibling one."""
+    cached = _HEALTH_CACHE.get(provider_name)
+    if cached is not None and time.monotonic() - cached[0] < HEALTH_CACHE_TTL:
+        return cached[1]
+    data = load_cached_result(_health_cache_key(provider_name), HEALTH_CACHE_CONFIG)
+    try:
+        return ProviderStatus(**data) if isinstance(data, dict) else None
+    except TypeError:
+        return None
+
+
+def store_cached_health(status: ProviderStatus) -> None:
+    _HEALTH_CACHE[status.provider] = (time.monotonic(), status)
+    store_cached_result(_health_cache_key(status.provider), to_dict(status), HEALTH_CACHE_CONFIG)
+
+
+def invalidate_cached_health(provider_name: str) -> None:
+    """Forget a provider's probe result, e.g. after it fails a real call."""
+    _HEALTH_CACHE.pop(provider_name, None)
+    try:
+        os.remove(os.path.join(HEALTH_CACHE_CONFIG.directory,
+                               _health_cache_key(provider_name) + ".json"))
+    except OSError:
+        pass
+
 
 async def test_provider_availability(
     provider_name: str,
-    timeout: float = 15.0
+    timeout: float = 15.0,
+    use_cache: bool = True
 ) -> ProviderStatus:
     """Test if a provider is available and responsive.
 
     Only tests gemini and codex - Claude is assumed always available.
+    Successful results are cached for HEALTH_CACHE_TTL seconds, in memory
+    and in HEALTH_CACHE_CONFIG.directory.
 
     Args:
         provider_name: Provider to test ("gemini" or "codex")
         timeout: Maximum time to wait for response
+        use_cache: Reuse and store cached probe results (off for --no-cache)
 
     Returns:
         ProviderStatus with availability information
@@ -272,6 +557,7 @@ async def test_provider_availability(
     if provider_name == "claude":
         return ProviderStatus(provider="claude", available=True)
 
+    load_sdk()
     provider = PROVIDER_MAP.get(provider_name)
     if not provider:
         return ProviderStatus(
@@ -281,6 +567,10 @@ async def test_provider_availability(
             error_type="invalid_provider"
         )
 
+    cached = load_cached_health(provider_name) if use_cache else None
+    if cached is not None:
+        return cached
+
     # Check API key first
     api_check = validate_api_keys(provider_name)
     if not api_check["valid"]:
@@ -291,26 +581,33 @@ async def test_provider_availability(
             error_type="auth"
         )
 
-    start_time = time.time()
+    start_time = time.monotonic()
 
     try:
-        config = LLMConfig(
+        llm_options = dict(
             provider=provider,
             tier=ModelTier.LOW,  # Use cheap tier for health check
             timeout=timeout,
         )
 
-        async with LLM(config) as llm:
+        llm = await get_llm(**llm_options)
+        try:
             result = await llm.run(AVAILABILITY_TEST_PROMPT)
+        except Exception:
+            await discard_llm(**llm_options)
+            raise
 
-        latency_ms = (time.time() - start_time) * 1000
+        latency_ms = (time.monotonic() - start_time) * 1000
 
         if result.success:
-            return ProviderStatus(
+            status = ProviderStatus(
                 provider=provider_name,
                 available=True,
                 latency_ms=latency_ms
             )
+            if use_cache:
+                store_cached_health(status)
+            return status
         else:
             error_type = classify_error(result.error or "")
             return ProviderStatus(
@@ -338,12 +635,14 @@ async def test_provider_availability(
 
 
 async def run_pre_debate_health_checks(
-    requested_providers: List[str]
+    requested_providers: List[str],
+    use_cache: bool = True
 ) -> Dict[str, ProviderStatus]:
     """Run health checks for all non-Claude providers before debate.
 
     Args:
         requested_providers: List of provider names to check
+        use_cache: Reuse and store cached probe results
 
     Returns:
         Dict mapping provider name to ProviderStatus
@@ -351,11 +650,11 @@ async def run_pre_debate_health_checks(
     health_results = {}
 
     # Filter to only check gemini and codex (Claude assumed available)
-    providers_to_check = [p for p in requested_providers if p in ["gemini", "codex"]]
+    providers_to_check = [p for p in requested_providers if p in HEALTH_CHECKED_PROVIDERS]
 
     # Run checks in parallel
     if providers_to_check:
-        tasks = [test_provider_availability(p) for p in providers_to_check]
+        tasks = [test_provider_availability(p, use_cache=use_cache) for p in providers_to_check]
         results = await asyncio.gather(*tasks)
         for status in results:
             health_results[status.provider] = status
@@ -367,67 +666,102 @@ async def run_pre_debate_health_checks(
 # ROBUST JSON PARSING
 # =============================================================================
 
+_TRAILING_COMMA_OBJ = re.compile(r',\s*}')
+_TRAILING_COMMA_ARR = re.compile(r',\s*]')
+_UNQUOTED_KEY = re.compile(r'(?<=[{,\s])(\w+)(?=\s*:)')
+
+
 def fix_trailing_commas(text: str) -> str:
     """Remove trailing commas before closing brackets/braces."""
-    text = re.sub(r',\s*}', '}', text)
-    text = re.sub(r',\s*]', ']', text)
+    text = _TRAILING_COMMA_OBJ.sub('}', text)
+    text = _TRAILING_COMMA_ARR.sub(']', text)
     return text
 
 
 def fix_unquoted_keys(text: str) -> str:
     """Attempt to fix unquoted keys in JSON-like text."""
-    pattern = r'(?<=[{,\s])(\w+)(?=\s*:)'
-    return re.sub(pattern, r'"\1"', text)
+    return _UNQUOTED_KEY.sub(r'"\1"', text)
+
+
+# Fence patterns compiled once; each locates opening and closing fence in one scan
+_JSON_FENCE_RE = re.compile(r"```json(.*?)```", re.DOTALL)
+_FENCE_RE = re.compile(r"```(.*?)```", re.DOTALL)
+_BRACE_RE = re.compile(r"[{}]")
 
 
 def extract_json_block(text: str) -> str:
     """Extract JSON from markdown code blocks or find JSON object."""
-    # Try markdown code block first
-    if "```json" in text:
-        start = text.find("```json") + 7
-        end = text.find("```", start)
-        if end > start:
-            return text[start:end].strip()
-
-    if "```" in text:
-        start = text.find("```") + 3
-        end = text.find("```", start)
-        if end > start:
-            return text[start:end].strip()
-
-    # Try to find JSON object boundaries
+    # Try markdown code block first (```json preferred over a bare fence)
+    for fence_re in (_JSON_FENCE_RE, _FENCE_RE):
+        match = fence_re.search(text)
+        if match and match.end(1) > match.start(1):
+            return match.group(1).strip()
+
+    # Try to find JSON object boundaries, visiting only brace characters
     brace_start = text.find('{')
     if brace_start >= 0:
         depth = 0
-        for i, char in enumerate(text[brace_start:], brace_start):
-            if char == '{':
+        for match in _BRACE_RE.finditer(text, brace_start):
+            if match.group() == '{':
                 depth += 1
-            elif char == '}':
+            else:
                 depth -= 1
                 if depth == 0:
-                    return text[brace_start:i+1]
+                    return text[brace_start:match.end()]
 
     return text
 
 
+# Shared decoder so raw_decode reuses its scanner across calls
+_JSON_DECODER = json.JSONDecoder()
+
+
+def decode_embedded_json(text: str) -> Any:
+    """
+    Decode the first JSON value after a ```json fence (or the first '{').
+
+    raw_decode stops at the end of the value, so no closing fence or
+    brace matching is needed and trailing prose is ignored.
+    """
+    start = text.find("```json")
+    start = start + 7 if start >= 0 else text.find('{')
+    if start < 0:
+        raise json.JSONDecodeError("No JSON value found", text, 0)
+
+    start = json.decoder.WHITESPACE.match(text, start).end()
+    parsed, _ = _JSON_DECODER.raw_decode(text, start)
+    return parsed
+
+
+# Recovery strategies, tried in order once the text fails to parse as-is
+_RECOVERY_STRATEGIES = (
+    ("raw_decode", decode_embedded_json),
+    ("extract_block", lambda t: _loads(extract_json_block(t))),
+    ("fix_commas", lambda t: _loads(fix_trailing_commas(extract_json_block(t)))),
+    ("fix_keys", lambda t: _loads(fix_unquoted_keys(fix_trailing_commas(extract_json_block(t))))),
+)
+_STRATEGY_NAMES = ("direct",) + tuple(name for name, _ in _RECOVERY_STRATEGIES)
+
+
 def robust_json_parse(text: str) -> Dict[str, Any]:
     """
     Try multiple parsing strategies before giving up.
 
     Returns parsed JSON or a structured error response.
     """
-    strategies: List[tuple] = [
-        ("direct", lambda t: t),
-        ("extract_block", extract_json_block),
-        ("fix_commas", lambda t: fix_trailing_commas(extract_json_block(t))),
-        ("fix_keys", lambda t: fix_unquoted_keys(fix_trailing_commas(extract_json_block(t)))),
-    ]
+    # Clean JSON is the common case; skip the recovery ladder for it
+    try:
+        return {
+            "parsed": True,
+            "data": _loads(text),
+            "strategy_used": "direct"
+        }
+    except json.JSONDecodeError as e:
+        last_error = str(e)
 
-    last_error = None
-    for strategy_name, transform in strategies:
+    for strategy_name, parse in _RECOVERY_STRATEGIES:
         try:
-            transformed = transform(text)
-            parsed = json.loads(transformed)
+            parsed = parse(text)
             return {
                 "parsed": True,
                 "data": parsed,
@@ -442,7 +776,7 @@ def robust_json_parse(text: str) -> Dict[str, Any]:
         "parsed": False,
         "raw_response": text,
         "parse_error": last_error,
-        "strategies_tried": [s[0] for s in strategies]
+        "strategies_tried": list(_STRATEGY_NAMES)
     }
 
 
@@ -460,18 +794,42 @@ class NonRetryableError(Exception):
     pass
 
 
+# Jitter only needs to spread retries apart; a seedable generator keeps
+# test runs reproducible
+_RETRY_RANDOM = random.Random()
+
+
+def retry_delay(config: RetryConfig, attempt: int) -> float:
+    """Backoff before retrying after the given (1-based) failed attempt.
+
+    Exponential, capped at max_delay and jittered so that debaters
+    rate-limited together don't all retry at once.
+    """
+    delay = config.delays[attempt - 1]
+    if config.jitter == "full":
+        return _RETRY_RANDOM.uniform(0, delay)
+    if config.jitter == "equal":
+        return delay / 2 + _RETRY_RANDOM.uniform(0, delay / 2)
+    return delay
+
+
 async def with_retry(
     func: Callable,
+    *args: Any,
     config: RetryConfig = RETRY_CONFIG,
-    on_retry: Optional[Callable[[int, Exception], None]] = None
+    on_retry: Optional[Callable[[int, Exception], None]] = None,
+    deadline: Optional[float] = None
 ) -> Any:
     """
     Execute an async function with exponential backoff retry.
 
     Args:
         func: Async function to execute
+        *args: Positional arguments passed to func on every attempt
         config: Retry configuration
         on_retry: Optional callback for retry events
+        deadline: Optional time.monotonic() instant; no attempt or backoff
+            starts that would end past it
 
     Returns:
         Result from successful function execution
@@ -482,8 +840,10 @@ async def with_retry(
     last_exception = None
 
     for attempt in range(1, config.max_attempts + 1):
+        if deadline is not None and time.monotonic() >= deadline:
+            raise last_exception or asyncio.TimeoutError()
         try:
-            return await func()
+            return await func(*args)
         except NonRetryableError:
             raise
         except Exception as e:
@@ -492,11 +852,11 @@ async def with_retry(
             if attempt == config.max_attempts:
                 break
 
-            # Calculate delay with exponential backoff
-            delay = min(
-                config.base_delay * (config.exponential_base ** (attempt - 1)),
-                config.max_delay
-            )
+            delay = retry_delay(config, attempt)
+
+            # Fail fast rather than sleep into the deadline
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                break
 
             if on_retry:
                 on_retry(attempt, e)
@@ -506,6 +866,86 @@ async def with_retry(
     raise last_exception
 
 
+async def run_with_deadline(awaitable, timeout: float) -> Any:
+    """Await under a single deadline, raising asyncio.TimeoutError when it passes.
+
+    Uses an asyncio.timeout() cancel scope where available (3.11+), which
+    cancels in place instead of wrapping the awaitable in another task.
+    """
+    if hasattr(asyncio, "timeout"):
+        async with asyncio.timeout(timeout):
+            return await awaitable
+    return await asyncio.wait_for(awaitable, timeout)
+
+
+# =============================================================================
+# CIRCUIT BREAKER
+# =============================================================================
+
+class CircuitOpenError(NonRetryableError):
+    """Raised instead of calling a provider whose circuit is open."""
+    pass
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker for one provider: closed, open or half-open.
+
+    While open, calls fail immediately so the phase falls back without
+    spending its retry budget; after the cooldown a single probe call is let
+    through, and its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, config: BreakerConfig = BREAKER_CONFIG,
+                 clock: Callable[[], float] = time.monotonic):
+        self.config = config
+        self.clock = clock
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_inflight = False  # the event loop is single-threaded
+
+    def allow(self) -> bool:
+        if self.state == "closed":
+            return True
+        if self.state == "open":
+            if self.clock() - self.opened_at < self.config.cooldown:
+                return False
+            self.state = "half_open"
+        if self.probe_inflight:
+            return False
+        self.probe_inflight = True
+        return True
+
+    def release(self) -> None:
+        """Forget an in-flight probe that was abandoned without an outcome."""
+        self.probe_inflight = False
+
+    def record_success(self) -> None:
+        self.state = "closed"
+        self.failures = 0
+        self.probe_inflight = False
+
+    def record_failure(self, recoverable: bool = True) -> None:
+        self.probe_inflight = False
+        if not recoverable:
+            return  # auth/input errors say nothing about provider health
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.config.failure_threshold:
+            self.state = "open"
+            self.opened_at = self.clock()
+
+
+_BREAKERS: Dict["Provider", CircuitBreaker] = {}
+
+
+def get_breaker(provider: "Provider") -> CircuitBreaker:
+    """Return the process-wide circuit breaker for a provider."""
+    breaker = _BREAKERS.get(provider)
+    if breaker is None:
+        breaker = _BREAKERS[provider] = CircuitBreaker()
+    return breaker
+
+
 # =============================================================================
 # PHASE PROMPTS - Each phase has specific context and output requirements
 # =============================================================================
@@ -554,13 +994,12 @@ Be thorough. This research will be your foundation for the entire debate.""",
 
 TOPIC: {topic}
 YOUR VIEWPOINT: {viewpoint}
-ROUND: {round} (You speak FIRST this round)
 
 YOUR PRIVATE RESEARCH:
 {own_research}
 
 INSTRUCTIONS:
-As the first speaker of Round {round}, you must:
+As the first speaker of this round, you must:
 1. Present your position clearly and persuasively
 2. Support your claims with evidence from your research
 3. Establish the strongest possible foundation for your viewpoint
@@ -585,21 +1024,18 @@ OUTPUT FORMAT (JSON):
         "challenge_to_opponents": "What you challenge others to address"
     }},
     "confidence_level": 0.0-1.0
-}}""",
+}}
+
+ROUND: {round} (You speak FIRST this round)""",
 
     "round_claim_attack": """You are Debater {role} in a structured debate.
 
 TOPIC: {topic}
 YOUR VIEWPOINT: {viewpoint}
-ROUND: {round}
-SPEAKING ORDER: You are speaker #{speaker_order} this round
 
 YOUR PRIVATE RESEARCH:
 {own_research}
 
-STATEMENTS MADE SO FAR THIS ROUND:
-{visible_statements}
-
 INSTRUCTIONS:
 1. Present your position clearly
 2. ATTACK the previous speakers' arguments:
@@ -635,22 +1071,23 @@ OUTPUT FORMAT (JSON):
         }}
     ],
     "confidence_level": 0.0-1.0
-}}""",
+}}
 
-    "prep_defense": """You are Debater {role} preparing for the next round.
+ROUND: {round}
+SPEAKING ORDER: You are speaker #{speaker_order} this round
+
+STATEMENTS MADE SO FAR THIS ROUND:
+{visible_statements}""",
+
+    "prep_defense": """You are Debater {role} in a structured debate.
 
 TOPIC: {topic}
 YOUR VIEWPOINT: {viewpoint}
-PREPARING FOR: Round {next_round}
 
-YOUR ORIGINAL RESEARCH:
+YOUR PRIVATE RESEARCH:
 {own_research}
 
-COMPLETE DEBATE HISTORY:
-{debate_history}
-
-ATTACKS YOU RECEIVED:
-{attacks_received}
+You are now preparing for the next round.
 
 INSTRUCTIONS:
 1. Analyze each attack against you carefully
@@ -694,29 +1131,25 @@ OUTPUT FORMAT (JSON):
         }}
     ],
     "updated_confidence": 0.0-1.0
-}}""",
+}}
 
-    "round_defense": """You are Debater {role} defending and counterattacking.
+PREPARING FOR: Round {next_round}
 
-TOPIC: {topic}
-YOUR VIEWPOINT: {viewpoint}
-ROUND: {round}
-{final_round_notice}
+COMPLETE DEBATE HISTORY:
+{debate_history}
 
-YOUR ORIGINAL RESEARCH:
-{own_research}
+ATTACKS YOU RECEIVED:
+{attacks_received}""",
 
-YOUR PREPARATION (including additional research):
-{own_prep}
+    "round_defense": """You are Debater {role} in a structured debate.
 
-COMPLETE DEBATE HISTORY:
-{debate_history}
+TOPIC: {topic}
+YOUR VIEWPOINT: {viewpoint}
 
-THIS ROUND SO FAR:
-{round_statements}
+YOUR PRIVATE RESEARCH:
+{own_research}
 
-ATTACKS YOU MUST ADDRESS:
-{attacks_to_address}
+You are now defending and counterattacking.
 
 INSTRUCTIONS:
 1. DEFEND against each attack on you with evidence
@@ -724,7 +1157,6 @@ INSTRUCTIONS:
    - Weak defenses they've made this round
    - New weaknesses exposed by their statements
 3. Use your additional research to strengthen both defense and attack
-{final_round_instructions}
 
 OUTPUT FORMAT (JSON):
 {{
@@ -751,42 +1183,315 @@ OUTPUT FORMAT (JSON):
     "updated_position": "Your refined position after this exchange",
     {consensus_field}
     "confidence_level": 0.0-1.0
-}}"""
+}}
+
+ROUND: {round}
+{final_round_notice}
+YOUR PREPARATION (including additional research):
+{own_prep}
+
+COMPLETE DEBATE HISTORY:
+{debate_history}
+
+THIS ROUND SO FAR:
+{round_statements}
+
+ATTACKS YOU MUST ADDRESS:
+{attacks_to_address}"""
+}
+
+def _compile_prompt(template: str) -> Callable[[Dict[str, Any]], str]:
+    """Pre-split a format template into (literal, field, spec) segments once.
+
+    Rendering then joins the segments directly instead of re-parsing the
+    multi-KB template on every call. Equivalent to template.format_map().
+    """
+    segments = [
+        (literal, field, spec or "")
+        for literal, field, spec, _ in string.Formatter().parse(template)
+    ]
+
+    def render(values: Dict[str, Any]) -> str:
+        return "".join([
+            literal + (format(values[field], spec) if field is not None else "")
+            for literal, field, spec in segments
+        ])
+
+    return render
+
+
+# Prompt renderers, compiled once at import
+_PROMPT_RENDERERS = {phase: _compile_prompt(template) for phase, template in PHASE_PROMPTS.items()}
+
+# Field names each phase's template references
+_PHASE_FIELDS = {
+    phase: frozenset(f for _, f, _, _ in string.Formatter().parse(template) if f)
+    for phase, template in PHASE_PROMPTS.items()
+}
+
+
+# round_defense fields that depend only on is_final, selected rather than rebuilt
+_FINAL_ROUND_FIELDS = {
+    True: {
+        "final_round_notice": (
+            "\n⚠️ THIS IS THE FINAL ROUND. You must also:\n"
+            "- PROPOSE CONSENSUS: What can all debaters agree on?\n"
+            "- Identify remaining disagreements clearly\n"
+        ),
+        "consensus_field": '"consensus_proposal": ["Point all can agree on", ...],',
+    },
+    False: {
+        "final_round_notice": "",
+        "consensus_field": "",
+    },
 }
 
 
-def build_prompt(phase: str, **kwargs) -> str:
+def build_prompt(phase: str, is_final: bool = False, **kwargs) -> str:
     """Build the appropriate prompt for the given phase."""
-    template = PHASE_PROMPTS.get(phase)
-    if not template:
+    render = _PROMPT_RENDERERS.get(phase)
+    if not render:
         raise ValueError(f"Unknown phase: {phase}")
 
     # Handle final round special fields
     if phase == "round_defense":
-        is_final = kwargs.get("is_final", False)
-        kwargs["final_round_notice"] = (
-            "\n⚠️ THIS IS THE FINAL ROUND. You must propose consensus points.\n"
-            if is_final else ""
-        )
-        kwargs["final_round_instructions"] = (
-            "\n4. PROPOSE CONSENSUS: What can all debaters agree on?\n"
-            "5. Identify remaining disagreements clearly"
-            if is_final else ""
-        )
-        kwargs["consensus_field"] = (
-            '"consensus_proposal": ["Point all can agree on", ...],'
-            if is_final else ""
-        )
+        kwargs.update(_FINAL_ROUND_FIELDS[bool(is_final)])
 
-    return template.format(**kwargs)
+    return render(kwargs)
+
+
+# =============================================================================
+# RESULT CACHE
+# =============================================================================
+
+# Phases whose output depends only on their inputs (plus web search), and
+# which are slow enough that repeating them for the same inputs is wasteful
+CACHED_PHASES = frozenset({"initial_research", "prep_defense"})
+
+
+def result_cache_key(provider: "Provider", phase: str, prompt: str) -> str:
+    """Hash the inputs that determine a cached phase's result.
+
+    Keying on the final prompt covers every field the phase template uses
+    (role included), template edits and the web-search instruction.
+    """
+    return hashlib.sha1("\x1f".join((provider.value, phase, prompt)).encode("utf-8")).hexdigest()
+
+
+def load_cached_result(key: str, cache_config: CacheConfig) -> Optional[Any]:
+    """Return a cached phase result, or None if disabled, missing, expired or unreadable."""
+    if not cache_config.enabled:
+        return None
+    path = os.path.join(cache_config.directory, key + ".json")
+    try:
+        if time.time() - os.path.getmtime(path) > cache_config.ttl:
+            return None
+        with open(path, "rb") as f:
+            return _loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def store_cached_result(key: str, result: Any, cache_config: CacheConfig) -> None:
+    """Write a phase result to the cache; failures only cost a future miss."""
+    if not cache_config.enabled:
+        return
+    path = os.path.join(cache_config.directory, key + ".json")
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_config.directory, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(_dumps(result))
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+# =============================================================================
+# STREAMING
+# =============================================================================
+
+# Characters that change JSON nesting state; a backslash pair is matched whole
+_STREAM_TOKEN_RE = re.compile(r'\\.|[{}"\\]', re.DOTALL)
+
+
+@dataclass(**_SLOTS)
+class StreamedResult:
+    """The parts of an llm.run() result that run_phase uses, for streamed text."""
+    text: str
+    session_id: Optional[str] = None
+    success: bool = False
+    error: Optional[str] = None
+
+
+class JsonObjectScanner:
+    """Detect, chunk by chunk, when a response's leading JSON object closes.
+
+    Only responses that open with the object (optionally inside a ```json
+    fence) are tracked; anything with prose first is read to the end as before.
+    """
+
+    def __init__(self):
+        self.head = ""
+        self.tracking: Optional[bool] = None  # None until the opening is known
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+
+    def feed(self, chunk: str) -> bool:
+        """Consume a chunk; return True once the top-level object has closed."""
+        if self.tracking is None:
+            self.head += chunk
+            head = self.head.lstrip()
+            if head.startswith("```json"):
+                head = head[7:].lstrip()
+            elif "```json".startswith(head):
+                return False  # fence (or nothing) so far; need more text
+            if not head:
+                return False
+            self.tracking = head.startswith("{")
+            chunk = head
+        if not self.tracking:
+            return False
+
+        start = 0
+        if self.escape:
+            self.escape = False
+            start = 1
+        for match in _STREAM_TOKEN_RE.finditer(chunk, start):
+            token = match.group()
+            if self.in_string:
+                if token == '"':
+                    self.in_string = False
+                elif token == "\\":
+                    self.escape = True  # escape pair split across chunks
+            elif token == '"':
+                self.in_string = True
+            elif token == "{":
+                self.depth += 1
+            elif token == "}":
+                self.depth -= 1
+                if self.depth == 0:
+                    return True
+        return False
+
+
+def _chunk_text(chunk: Any) -> str:
+    return chunk if isinstance(chunk, str) else (getattr(chunk, "text", None) or "")
+
+
+def _is_final_event(event: Any) -> bool:
+    """A stream ends with the same result object run() returns (it has .success)."""
+    return not isinstance(event, str) and getattr(event, "success", None) is not None
+
+
+async def run_llm(llm: "LLM", prompt: str) -> Any:
+    """Run a prompt, streaming the response when the client supports it.
+
+    stream(prompt) must return an async iterator of text chunks (str, or
+    objects with .text) that ends with the final result object run() would
+    return, i.e. an event whose .success is not None; its success and error
+    are reported, and a session_id is taken from whichever event carries
+    one. While streaming, the response is scanned as it arrives and the
+    stream is closed as soon as a leading JSON object is complete and
+    decodes, so any trailing prose is never waited for; that counts as
+    success. A stream that stops before either happens is reported as
+    failed. Clients without stream() use run(). Either way the caller must
+    check the result's success (execute_llm raises when it is false).
+    """
+    stream = getattr(llm, "stream", None)
+    if stream is None:
+        return await llm.run(prompt)
+
+    parts = []
+    result = StreamedResult(text="", error="Stream ended before a final result")
+    scanner = JsonObjectScanner()
+    chunks = stream(prompt)
+    try:
+        async for event in chunks:
+            session_id = getattr(event, "session_id", None)
+            if session_id is not None:
+                result.session_id = session_id
+            if _is_final_event(event):
+                result.success = bool(event.success)
+                result.error = getattr(event, "error", None)
+                if not parts:  # a final result may carry the whole text itself
+                    parts.append(_chunk_text(event))
+                break
+            text = _chunk_text(event)
+            parts.append(text)
+            if scanner.feed(text):
+                joined = "".join(parts)
+                try:
+                    decode_embedded_json(joined)
+                except json.JSONDecodeError:
+                    scanner.tracking = False  # malformed; let robust_json_parse see it all
+                else:
+                    parts = [joined]  # the final join then returns it without copying
+                    result.success, result.error = True, None
+                    break
+    finally:
+        aclose = getattr(chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    result.text = "".join(parts)
+    return result
 
 
 # =============================================================================
 # MAIN EXECUTION LOGIC
 # =============================================================================
 
+async def _run_pooled(llm_options: Dict[str, Any], prompt: str) -> Any:
+    llm = await get_llm(**llm_options)
+    return await run_llm(llm, prompt)
+
+
+async def execute_llm(
+    breaker: CircuitBreaker,
+    llm_options: Dict[str, Any],
+    prompt: str,
+    deadline: Optional[float] = None
+) -> Any:
+    """Make one breaker-guarded LLM call on a pooled client (one retry attempt)."""
+    provider = llm_options["provider"]
+    if not breaker.allow():
+        raise CircuitOpenError(
+            f"Circuit open for {provider.value} after repeated failures; skipping call"
+        )
+    # Pooled clients outlive a single call, so bound each attempt here too; a
+    # hung request then becomes a retryable timeout. An attempt never runs
+    # past the phase deadline.
+    timeout = llm_options["timeout"]
+    if deadline is not None:
+        timeout = min(timeout, deadline - time.monotonic())
+    try:
+        result = await run_with_deadline(_run_pooled(llm_options, prompt), timeout)
+        if not result.success:
+            # A failed (or truncated streamed) response is a failed attempt:
+            # retried, counted by the breaker and never cached
+            raise RetryableError(result.error or "LLM call failed without an error message")
+    except asyncio.CancelledError:
+        # Abandoned mid-request (phase deadline or lost hedge): the client
+        # may hold a half-read response, and the call says nothing about health
+        breaker.release()
+        await discard_llm(**llm_options)
+        raise
+    except Exception as e:
+        breaker.record_failure(classify_exception(e) in FALLBACK_ERROR_PATTERNS)
+        # Retry on a fresh client rather than a possibly broken one
+        await discard_llm(**llm_options)
+        raise
+    breaker.record_success()
+    return result
+
+
 async def run_phase(
-    provider: Provider,
+    provider: "Provider",
     role: str,
     phase: str,
     topic: str,
@@ -801,33 +1506,48 @@ async def run_phase(
     own_prep: str = "",
     round_statements: str = "",
     attacks_to_address: str = "",
+    cache_config: CacheConfig = CACHE_CONFIG,
 ) -> dict:
     """Run a debate phase with the specified LLM provider."""
+    load_sdk()
 
-    start_time = time.time()
-
-    prompt = build_prompt(
-        phase=phase,
-        role=role,
-        topic=topic,
-        viewpoint=viewpoint,
-        round=round_num,
-        next_round=round_num + 1 if phase == "prep_defense" else round_num,
-        speaker_order=speaker_order,
-        is_final=is_final,
-        own_research=own_research,
-        visible_statements=visible_statements,
-        debate_history=debate_history,
-        attacks_received=attacks_received,
-        own_prep=own_prep,
-        round_statements=round_statements,
-        attacks_to_address=attacks_to_address,
-    )
+    start_time = time.monotonic()
+
+    # Every return path fills in this one dict
+    response = {
+        "success": True,
+        "provider": provider.value,
+        "role": role,
+        "phase": phase,
+        "round": round_num,
+    }
+
+    prompt_context = {
+        "role": role,
+        "topic": topic,
+        "viewpoint": viewpoint,
+        "round": round_num,
+        "next_round": round_num + 1 if phase == "prep_defense" else round_num,
+        "speaker_order": speaker_order,
+        "own_research": own_research,
+        "visible_statements": visible_statements,
+        "debate_history": debate_history,
+        "attacks_received": attacks_received,
+        "own_prep": own_prep,
+        "round_statements": round_statements,
+        "attacks_to_address": attacks_to_address,
+    }
+    # Pass only the context this phase's template references
+    fields_used = _PHASE_FIELDS.get(phase)
+    if fields_used is not None:
+        prompt_context = {k: v for k, v in prompt_context.items() if k in fields_used}
+
+    prompt = build_prompt(phase, is_final=is_final, **prompt_context)
 
     # Enable web search for research and prep phases
-    enable_web = phase in ["initial_research", "prep_defense"]
+    enable_web = phase in WEB_SEARCH_PHASES
 
-    config = LLMConfig(
+    llm_options = dict(
         provider=provider,
         tier=ModelTier.HIGH,
         auto_approval=AutoApproval.FULL if enable_web else AutoApproval.NONE,
@@ -839,9 +1559,20 @@ async def run_phase(
     if enable_web:
         prompt = f"[You have access to web search. Use it to find current, verified information.]\n\n{prompt}"
 
-    async def execute_llm():
-        async with LLM(config) as llm:
-            return await llm.run(prompt)
+    cache_key = None
+    if cache_config.enabled and phase in CACHED_PHASES:
+        cache_key = result_cache_key(provider, phase, prompt)
+        cached = load_cached_result(cache_key, cache_config)
+        if cached is not None:
+            response.update(
+                session_id=None,
+                execution_time=time.monotonic() - start_time,
+                result=cached,
+                cache_hit=True,
+            )
+            return response
+
+    breaker = get_breaker(provider)
 
     retry_attempts = []
 
@@ -849,16 +1580,19 @@ async def run_phase(
         retry_attempts.append({
             "attempt": attempt,
             "error": str(error),
-            "timestamp": time.time() - start_time
+            "timestamp": time.monotonic() - start_time
         })
 
-    try:
-        # Execute with timeout and retry
-        timeout = TIMEOUT_CONFIG.get(phase)
+    # Execute with retry under one phase-wide deadline: every attempt and the
+    # backoff between them share the phase's timeout budget; attempts are
+    # clipped to it and no retry starts past it
+    timeout = TIMEOUT_CONFIG.get(phase)
+    deadline = start_time + timeout
 
-        result = await asyncio.wait_for(
-            with_retry(execute_llm, RETRY_CONFIG, on_retry),
-            timeout=timeout + 10  # Extra buffer for retries
+    try:
+        result = await with_retry(
+            execute_llm, breaker, llm_options, prompt, deadline,
+            config=RETRY_CONFIG, on_retry=on_retry, deadline=deadline
         )
 
         response_text = result.text.strip()
@@ -866,20 +1600,15 @@ async def run_phase(
         # Parse JSON with robust recovery
         parse_result = robust_json_parse(response_text)
 
-        response = {
-            "success": True,
-            "provider": provider.value,
-            "role": role,
-            "phase": phase,
-            "round": round_num,
-            "session_id": result.session_id,
-            "execution_time": time.time() - start_time,
-        }
+        response["session_id"] = result.session_id
+        response["execution_time"] = time.monotonic() - start_time
 
         if parse_result["parsed"]:
             response["result"] = parse_result["data"]
             if parse_result["strategy_used"] != "direct":
                 response["parse_recovery"] = parse_result["strategy_used"]
+            if cache_key:
+                store_cached_result(cache_key, response["result"], cache_config)
         else:
             response["result"] = {"raw_response": parse_result["raw_response"]}
             response["warning"] = "JSON parsing failed after all recovery attempts"
@@ -894,50 +1623,126 @@ async def run_phase(
         return response
 
     except asyncio.TimeoutError:
-        return {
-            "success": False,
-            "provider": provider.value,
-            "role": role,
-            "phase": phase,
-            "round": round_num,
-            "error": f"Timeout after {TIMEOUT_CONFIG.get(phase)}s",
-            "error_type": "timeout",
-            "execution_time": time.time() - start_time,
-            "retry_history": retry_attempts,
-        }
+        # execute_llm already recorded the timed-out attempt with the breaker
+        response.update(
+            success=False,
+            error=f"Timeout after {timeout}s",
+            error_type="timeout",
+            error_category="timeout",
+            execution_time=time.monotonic() - start_time,
+            retry_history=retry_attempts,
+        )
+        return response
 
     except Exception as e:
-        return {
-            "success": False,
-            "provider": provider.value,
-            "role": role,
-            "phase": phase,
-            "round": round_num,
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "execution_time": time.time() - start_time,
-            "retry_history": retry_attempts,
-        }
+        response.update(
+            success=False,
+            error=str(e),
+            error_type=type(e).__name__,
+            error_category=classify_exception(e),
+            execution_time=time.monotonic() - start_time,
+            retry_history=retry_attempts,
+        )
+        return response
 
 
 # =============================================================================
 # FALLBACK WRAPPER
 # =============================================================================
 
+async def cancel_tasks(*tasks: "asyncio.Future") -> None:
+    """Cancel the tasks that are still running and wait for them to finish."""
+    running = [task for task in tasks if not task.done()]
+    for task in running:
+        task.cancel()
+    if running:
+        await asyncio.gather(*running, return_exceptions=True)
+
+
+async def race_hedged(
+    primary_task: "asyncio.Future",
+    provider: "Provider",
+    fallback_provider: "Provider",
+    fallback_config: FallbackConfig,
+    hedge_config: HedgeConfig,
+    phase_args: Dict[str, Any],
+) -> dict:
+    """Race a still-running primary call against the fallback provider.
+
+    The first successful result wins and the other call is cancelled. A
+    primary failure that should_fallback() rejects is returned at once, as
+    in a serial fallback; if both fail, the fallback's result is returned.
+    Neither call outlives this coroutine, even when it is cancelled.
+    """
+    event = FallbackEvent(
+        phase=phase_args["phase"],
+        original_provider=provider.value,
+        fallback_provider=fallback_config.fallback_provider,
+        error_type="hedge",
+        error_message=f"No response after {hedge_config.hedge_after}s; hedged with {fallback_config.fallback_provider}",
+        timestamp=datetime.datetime.utcnow().isoformat() + "Z",
+    )
+
+    fallback_start = time.monotonic()
+    fallback_task = asyncio.ensure_future(run_phase(provider=fallback_provider, **phase_args))
+
+    winner = None
+    settled = None  # the task whose result is returned, once known
+    pending = {primary_task, fallback_task}
+    try:
+        while pending and settled is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task_result = task.result()
+                if task_result["success"]:
+                    winner = settled = task
+                    break
+                if task is primary_task:
+                    if not should_fallback(task_result):
+                        # Not a provider-health error (e.g. bad input): a serial
+                        # fallback wouldn't run either, so report it as is
+                        settled = task
+                        break
+                    # The provider just failed; don't trust an earlier health check
+                    invalidate_cached_health(provider.value)
+    finally:
+        # Cancel the loser (or both, if we are being cancelled ourselves)
+        await cancel_tasks(primary_task, fallback_task)
+
+    if settled is primary_task:
+        result = primary_task.result()
+    else:
+        result = fallback_task.result()
+        result["fallback_used"] = True
+        result["original_provider"] = provider.value
+        event.recovery_time_ms = (time.monotonic() - fallback_start) * 1000
+
+    record = to_dict(event)
+    if winner is None:
+        record["winner"] = None  # both calls failed
+    else:
+        record["winner"] = provider.value if winner is primary_task else fallback_config.fallback_provider
+    result["fallback_history"] = [record]
+    return result
+
+
 async def run_phase_with_fallback(
-    provider: Provider,
+    provider: "Provider",
     role: str,
     phase: str,
     topic: str,
     viewpoint: str,
     fallback_config: FallbackConfig = FALLBACK_CONFIG,
+    hedge_config: HedgeConfig = HEDGE_CONFIG,
     **kwargs
 ) -> dict:
     """Run a debate phase with automatic fallback on recoverable errors.
 
     This wrapper attempts the phase with the primary provider, and if a
     recoverable error occurs (rate limit, quota, timeout, etc.), automatically
-    retries with the fallback provider (default: Claude).
+    retries with the fallback provider (default: Claude). With hedging
+    enabled, a primary call still running after hedge_after seconds is raced
+    against the fallback provider instead of waited out.
 
     Args:
         provider: Primary LLM provider to use
@@ -946,27 +1751,40 @@ async def run_phase_with_fallback(
         topic: Debate topic
         viewpoint: Assigned viewpoint for this debater
         fallback_config: Configuration for fallback behavior
+        hedge_config: Configuration for hedged fallback requests
         **kwargs: Additional arguments passed to run_phase()
 
     Returns:
         Phase result dict, with fallback metadata if fallback occurred
     """
     fallback_history = []
+    phase_args = dict(role=role, phase=phase, topic=topic, viewpoint=viewpoint, **kwargs)
+    fallback_provider = PROVIDER_MAP.get(fallback_config.fallback_provider)
 
     # Try with primary provider
-    result = await run_phase(
-        provider=provider,
-        role=role,
-        phase=phase,
-        topic=topic,
-        viewpoint=viewpoint,
-        **kwargs
-    )
+    if (hedge_config.enabled and fallback_config.enabled and phase in hedge_config.phases
+            and fallback_provider and fallback_provider != provider):
+        primary_task = asyncio.ensure_future(run_phase(provider=provider, **phase_args))
+        try:
+            done, _ = await asyncio.wait({primary_task}, timeout=hedge_config.hedge_after)
+            if not done:
+                return await race_hedged(
+                    primary_task, provider, fallback_provider,
+                    fallback_config, hedge_config, phase_args
+                )
+            result = primary_task.result()
+        finally:
+            await cancel_tasks(primary_task)
+    else:
+        result = await run_phase(provider=provider, **phase_args)
 
     # Check if fallback is needed
-    if not result["success"] and fallback_config.enabled and should_fallback(result):
-        fallback_provider = PROVIDER_MAP.get(fallback_config.fallback_provider)
+    needs_fallback = not result["success"] and should_fallback(result)
+    if needs_fallback:
+        # The provider just failed; don't trust an earlier health check
+        invalidate_cached_health(provider.value)
 
+    if needs_fallback and fallback_config.enabled:
         # Only fallback if we have a different provider
         if fallback_provider and fallback_provider != provider:
             # Record the fallback event
@@ -974,25 +1792,18 @@ async def run_phase_with_fallback(
                 phase=phase,
                 original_provider=provider.value,
                 fallback_provider=fallback_config.fallback_provider,
-                error_type=classify_error(result.get("error", "")),
+                error_type=result.get("error_category") or classify_error(result.get("error", "")),
                 error_message=result.get("error", ""),
-                timestamp=datetime.utcnow().isoformat() + "Z",
+                timestamp=datetime.datetime.utcnow().isoformat() + "Z",
             )
 
             # Execute with fallback provider
-            fallback_start = time.time()
-            result = await run_phase(
-                provider=fallback_provider,
-                role=role,
-                phase=phase,
-                topic=topic,
-                viewpoint=viewpoint,
-                **kwargs
-            )
+            fallback_start = time.monotonic()
+            result = await run_phase(provider=fallback_provider, **phase_args)
 
             # Record recovery time
-            event.recovery_time_ms = (time.time() - fallback_start) * 1000
-            fallback_history.append(asdict(event))
+            event.recovery_time_ms = (time.monotonic() - fallback_start) * 1000
+            fallback_history.append(to_dict(event))
 
             # Add fallback metadata to result
             result["fallback_used"] = True
@@ -1005,6 +1816,182 @@ async def run_phase_with_fallback(
     return result
 
 
+# =============================================================================
+# BATCH EXECUTION
+# =============================================================================
+
+BATCH_REQUIRED_FIELDS = ("provider", "role", "phase", "topic", "viewpoint")
+
+BATCH_CONTEXT_DEFAULTS = {
+    "own_research": "{}",
+    "visible_statements": "",
+    "debate_history": "",
+    "attacks_received": "",
+    "own_prep": "{}",
+    "round_statements": "",
+    "attacks_to_address": "",
+}
+
+
+async def run_batch_spec(
+    spec: Any,
+    fallback_config: FallbackConfig,
+    health_results: Dict[str, ProviderStatus],
+    cache_config: CacheConfig = CACHE_CONFIG,
+    hedge_config: HedgeConfig = HEDGE_CONFIG,
+) -> dict:
+    """Run one batch entry, applying the same checks as a single CLI call."""
+    if not isinstance(spec, dict):
+        return {
+            "success": False,
+            "error": "Batch entry must be a JSON object",
+            "error_type": "invalid_input"
+        }
+
+    missing = [f for f in BATCH_REQUIRED_FIELDS if not spec.get(f)]
+    if missing:
+        return {
+            "success": False,
+            "error": f"Missing required fields: {', '.join(missing)}",
+            "error_type": "invalid_input"
+        }
+
+    provider_name = spec["provider"]
+    api_check = validate_api_keys(provider_name)
+    if not api_check["valid"]:
+        return {
+            "success": False,
+            "error": api_check["error"],
+            "error_type": "api_key_missing"
+        }
+
+    provider = PROVIDER_MAP.get(provider_name)
+    if not provider:
+        return {
+            "success": False,
+            "error": f"Unknown provider: {provider_name}",
+            "available_providers": list(PROVIDER_MAP.keys())
+        }
+
+    pre_debate_warning = None
+    status = health_results.get(provider_name)
+    if status and not status.available:
+        if not fallback_config.enabled:
+            return {
+                "success": False,
+                "error": f"Provider {provider_name} unavailable: {status.error}",
+                "error_type": status.error_type,
+                "provider_status": to_dict(status)
+            }
+        provider = PROVIDER_MAP[fallback_config.fallback_provider]
+        pre_debate_warning = {
+            "message": f"{provider_name} unavailable, using {fallback_config.fallback_provider}",
+            "original_provider": provider_name,
+            "error": status.error,
+            "error_type": status.error_type
+        }
+
+    result = await run_phase_with_fallback(
+        provider=provider,
+        role=spec["role"],
+        phase=spec["phase"],
+        topic=spec["topic"],
+        viewpoint=spec["viewpoint"],
+        fallback_config=fallback_config,
+        cache_config=cache_config,
+        hedge_config=hedge_config,
+        round_num=int(spec.get("round", 1)),
+        speaker_order=int(spec.get("speaker_order", 1)),
+        is_final=bool(spec.get("is_final", False)),
+        **{k: spec.get(k, default) for k, default in BATCH_CONTEXT_DEFAULTS.items()}
+    )
+
+    if pre_debate_warning:
+        result["pre_debate_fallback"] = pre_debate_warning
+
+    return result
+
+
+async def run_batch(
+    specs: List[Any],
+    fallback_config: FallbackConfig = FALLBACK_CONFIG,
+    skip_health_check: bool = False,
+    cache_config: CacheConfig = CACHE_CONFIG,
+    hedge_config: HedgeConfig = HEDGE_CONFIG,
+) -> List[dict]:
+    """Run several phase specs concurrently in one event loop.
+
+    Each spec carries the CLI options of one call, with underscores in place
+    of dashes (e.g. "speaker_order", "own_research"). Providers are health
+    checked once for the whole batch. Results are returned in spec order; an
+    entry that is invalid or raises becomes an error result instead of
+    aborting the batch.
+    """
+    health_results = {}
+    if not skip_health_check:
+        providers = {s.get("provider") for s in specs if isinstance(s, dict)}
+        health_results = await run_pre_debate_health_checks(
+            sorted(p for p in providers if isinstance(p, str)),
+            use_cache=cache_config.enabled
+        )
+
+    results = await asyncio.gather(
+        *(run_batch_spec(s, fallback_config, health_results, cache_config, hedge_config)
+          for s in specs),
+        return_exceptions=True
+    )
+
+    return [
+        r if isinstance(r, dict) else {
+            "success": False,
+            "error": str(r),
+            "error_type": type(r).__name__
+        }
+        for r in results
+    ]
+
+
+# =============================================================================
+# EVENT LOOP
+# =============================================================================
+
+_EVENT_LOOP: Optional["asyncio.AbstractEventLoop"] = None
+_RUNNER: Optional["asyncio.Runner"] = None
+
+
+def _close_event_loop() -> None:
+    """Close pooled LLM clients and shut down the shared event loop at exit."""
+    if _RUNNER is not None:
+        _RUNNER.run(close_llm_pool())
+        _RUNNER.close()
+    elif _EVENT_LOOP is not None and not _EVENT_LOOP.is_closed():
+        _EVENT_LOOP.run_until_complete(close_llm_pool())
+        _EVENT_LOOP.run_until_complete(_EVENT_LOOP.shutdown_asyncgens())
+        _EVENT_LOOP.close()
+
+
+def run_sync(coro) -> Any:
+    """Run a coroutine on one event loop reused for the whole CLI invocation.
+
+    main() may await both the health check and the debate phase; reusing a
+    single loop avoids setting up and tearing down a loop for each. Uses
+    asyncio.Runner on Python 3.11+, a manually managed loop otherwise, and
+    a uvloop loop when uvloop is installed.
+    """
+    global _EVENT_LOOP, _RUNNER
+    if _RUNNER is None and _EVENT_LOOP is None:
+        atexit.register(_close_event_loop)
+        loop_factory = uvloop.new_event_loop if uvloop is not None else asyncio.new_event_loop
+        if hasattr(asyncio, "Runner"):
+            _RUNNER = asyncio.Runner(loop_factory=loop_factory)
+        else:
+            _EVENT_LOOP = loop_factory()
+            asyncio.set_event_loop(_EVENT_LOOP)
+    if _RUNNER is not None:
+        return _RUNNER.run(coro)
+    return _EVENT_LOOP.run_until_complete(coro)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Multi-LLM Debater v3 - Production-grade debate system"
@@ -1018,11 +2005,9 @@ def main():
 
     # Required arguments
     parser.add_argument("--provider",
-                        choices=["claude", "gpt", "codex", "gemini"])
-    parser.add_argument("--role", choices=["A", "B", "C"])
-    parser.add_argument("--phase",
-                        choices=["initial_research", "round_claim", "round_claim_attack",
-                                 "prep_defense", "round_defense"])
+                        choices=("claude", "gpt", "codex", "gemini"))
+    parser.add_argument("--role", choices=("A", "B", "C"))
+    parser.add_argument("--phase", choices=PHASES)
     parser.add_argument("--topic")
     parser.add_argument("--viewpoint")
 
@@ -1039,6 +2024,12 @@ def main():
                         help="Skip pre-debate provider availability test")
     parser.add_argument("--health-check-only", action="store_true",
                         help="Run health check and exit (requires --provider)")
+    parser.add_argument("--hedge-after", type=float, metavar="SECONDS",
+                        help="Race the fallback provider against a primary call still running after SECONDS")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Don't reuse or store cached research results and provider health probes")
+    parser.add_argument("--batch", action="store_true",
+                        help="Read a JSON array of phase specs from stdin and run them concurrently")
 
     # Context inputs (JSON strings)
     parser.add_argument("--own-research", default="{}")
@@ -1054,28 +2045,61 @@ def main():
     # Handle validation commands
     if args.validate_deps:
         result = validate_dependencies()
-        print(json.dumps(result, indent=2))
+        write_result(result)
         sys.exit(0 if result["valid"] else 1)
 
     if args.validate_api_key:
         result = validate_api_keys(args.validate_api_key)
-        print(json.dumps(result, indent=2))
+        write_result(result)
         sys.exit(0 if result["valid"] else 1)
 
+    load_sdk()
+
+    hedge_config = HEDGE_CONFIG
+    if args.hedge_after is not None:
+        hedge_config = HedgeConfig(enabled=True, hedge_after=args.hedge_after)
+
+    # Handle batch mode: phase specs come from stdin instead of the CLI
+    if args.batch:
+        try:
+            specs = _loads(sys.stdin.read())
+        except json.JSONDecodeError as e:
+            specs = None
+            batch_error = f"Invalid batch input: {e}"
+        else:
+            batch_error = "Batch input must be a JSON array of phase specs"
+        if not isinstance(specs, list):
+            write_result({
+                "success": False,
+                "error": batch_error,
+                "error_type": "invalid_input"
+            })
+            sys.exit(1)
+
+        results = run_sync(run_batch(
+            specs,
+            fallback_config=FallbackConfig(enabled=not args.disable_fallback),
+            skip_health_check=args.skip_health_check,
+            cache_config=CacheConfig(enabled=not args.no_cache),
+            hedge_config=hedge_config,
+        ))
+        write_result(results)
+        return
+
     # Handle health-check-only mode
     if args.health_check_only:
         if not args.provider:
             parser.error("--provider is required for --health-check-only")
-        health_result = asyncio.run(run_pre_debate_health_checks([args.provider]))
+        health_result = run_sync(run_pre_debate_health_checks([args.provider], use_cache=not args.no_cache))
         output = {
-            "health_check": {k: asdict(v) for k, v in health_result.items()}
+            "health_check": {k: to_dict(v) for k, v in health_result.items()}
         }
         # Claude is always available (not actually tested)
         if args.provider == "claude":
-            output["health_check"]["claude"] = asdict(ProviderStatus(
+            output["health_check"]["claude"] = to_dict(ProviderStatus(
                 provider="claude", available=True
             ))
-        print(json.dumps(output, indent=2))
+        write_result(output)
         sys.exit(0)
 
     # Validate required arguments for debate execution
@@ -1085,28 +2109,28 @@ def main():
     # Validate API key before execution
     api_check = validate_api_keys(args.provider)
     if not api_check["valid"]:
-        print(json.dumps({
+        write_result({
             "success": False,
             "error": api_check["error"],
             "error_type": "api_key_missing"
-        }))
+        })
         sys.exit(1)
 
     provider = PROVIDER_MAP.get(args.provider)
     if not provider:
-        print(json.dumps({
+        write_result({
             "success": False,
             "error": f"Unknown provider: {args.provider}",
             "available_providers": list(PROVIDER_MAP.keys())
-        }))
+        })
         sys.exit(1)
 
     # Pre-debate health check for gemini/codex (Claude is assumed available)
     effective_provider = provider
     pre_debate_warning = None
 
-    if not args.skip_health_check and args.provider in ["gemini", "codex"]:
-        health_results = asyncio.run(run_pre_debate_health_checks([args.provider]))
+    if not args.skip_health_check and args.provider in HEALTH_CHECKED_PROVIDERS:
+        health_results = run_sync(run_pre_debate_health_checks([args.provider], use_cache=not args.no_cache))
         status = health_results.get(args.provider)
 
         if status and not status.available:
@@ -1122,25 +2146,27 @@ def main():
                 print(json.dumps({"warning": pre_debate_warning}), file=sys.stderr)
             else:
                 # Fallback disabled - fail immediately
-                print(json.dumps({
+                write_result({
                     "success": False,
                     "error": f"Provider {args.provider} unavailable: {status.error}",
                     "error_type": status.error_type,
-                    "provider_status": asdict(status)
-                }))
+                    "provider_status": to_dict(status)
+                })
                 sys.exit(1)
 
     # Configure fallback behavior
     fallback_config = FallbackConfig(enabled=not args.disable_fallback)
 
     # Execute with fallback wrapper
-    result = asyncio.run(run_phase_with_fallback(
+    result = run_sync(run_phase_with_fallback(
         provider=effective_provider,
         role=args.role,
         phase=args.phase,
         topic=args.topic,
         viewpoint=args.viewpoint,
         fallback_config=fallback_config,
+        cache_config=CacheConfig(enabled=not args.no_cache),
+        hedge_config=hedge_config,
         round_num=args.round,
         speaker_order=args.speaker_order,
         is_final=args.is_final,
@@ -1157,7 +2183,7 @@ def main():
     if pre_debate_warning:
         result["pre_debate_fallback"] = pre_debate_warning
 
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    write_result(result)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,547 @@
+#!/usr/bin/env python3
+"""
+Philosopher Plugin Debater Test Runner
+
+Tests multi_llm_debater's phase execution machinery on the fake SDK in
+tests/fake_sdk.py: the circuit breaker, retry backoff and deadlines, the
+result cache, hedged fallback and batch mode.
+Run with: python3 tests/debater-test-runner.py
+"""
+
+import asyncio
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, List, Tuple
+
+# Colors for output
+GREEN = "\033[92m"
+RED = "\033[91m"
+RESET = "\033[0m"
+
+TESTS_DIR = Path(__file__).resolve().parent
+PLUGIN_ROOT = TESTS_DIR.parent
+DEBATER_SCRIPT = PLUGIN_ROOT / "scripts" / "multi_llm_debater.py"
+sys.path.insert(0, str(TESTS_DIR))
+
+import fake_sdk  # noqa: E402
+
+# Runs the debater CLI in a subprocess on the fake SDK, with one scripted reply
+CLI_BOOTSTRAP = f"""
+import runpy, sys
+sys.path.insert(0, {str(TESTS_DIR)!r})
+import fake_sdk
+fake_sdk.register()
+fake_sdk.script("claude", fake_sdk.Reply('{{"core_thesis": "cli"}}'))
+sys.argv[0] = {str(DEBATER_SCRIPT)!r}
+runpy.run_path(sys.argv[0], run_name="__main__")
+"""
+
+
+def load_debater():
+    """Import scripts/multi_llm_debater.py and bind the fake SDK into it."""
+    spec = importlib.util.spec_from_file_location("multi_llm_debater", DEBATER_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    fake_sdk.install(module)
+    return module
+
+
+def check(results: List[Tuple[str, bool, str]], name: str, ok: bool, detail: Any = ""):
+    results.append((name, ok, str(detail)))
+
+
+def run_cli(cache_dir: str, *args: str, stdin: bytes = b"") -> Any:
+    """Run the debater CLI; a failing run returns its exit code and output."""
+    env = dict(os.environ, DEBATE_CACHE_DIR=cache_dir, ANTHROPIC_API_KEY="test")
+    proc = subprocess.run(
+        [sys.executable, "-c", CLI_BOOTSTRAP, *args],
+        input=stdin, capture_output=True, env=env, timeout=30
+    )
+    try:
+        output = json.loads(proc.stdout)
+    except json.JSONDecodeError:
+        output = proc.stderr.decode(errors="replace")
+    if proc.returncode != 0:
+        return {"returncode": proc.returncode, "output": output}
+    return output
+
+
+async def cache_tests(debater, results: List[Tuple[str, bool, str]]) -> None:
+    claude = fake_sdk.Provider.CLAUDE
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = debater.CacheConfig(directory=cache_dir, ttl=60.0)
+
+        debater.store_cached_result("k", {"a": [1, "é"]}, cache)
+        check(results, "Cache stores and loads a result",
+              debater.load_cached_result("k", cache) == {"a": [1, "é"]}, os.listdir(cache_dir))
+        check(results, "Cache load misses an unknown key",
+              debater.load_cached_result("other", cache) is None)
+
+        path = os.path.join(cache_dir, "k.json")
+        expired = os.path.getmtime(path) - 120
+        os.utime(path, (expired, expired))
+        check(results, "Cache entry older than the TTL is ignored",
+              debater.load_cached_result("k", cache) is None)
+
+        disabled = debater.CacheConfig(enabled=False, directory=cache_dir)
+        debater.store_cached_result("off", {"a": 1}, disabled)
+        check(results, "Disabled cache stores nothing and loads nothing",
+              not os.path.exists(os.path.join(cache_dir, "off.json"))
+              and debater.load_cached_result("k", disabled) is None)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = debater.CacheConfig(directory=cache_dir)
+        fake_sdk.reset(debater)
+        fake_sdk.script("claude", fake_sdk.Reply('{"core_thesis": "x"}'))
+        first = await debater.run_phase(claude, "A", "initial_research", "T", "V", cache_config=cache)
+        second = await debater.run_phase(claude, "A", "initial_research", "T", "V", cache_config=cache)
+        check(results, "Repeated research phase is served from the cache",
+              not first.get("cache_hit") and second.get("cache_hit")
+              and second["result"] == first["result"] and len(fake_sdk.CALLS) == 1,
+              (first, second))
+
+        # prep_defense's prompt names the role, so each role gets its own entry
+        fake_sdk.script("claude", fake_sdk.Reply('{"role": "A"}'), fake_sdk.Reply('{"role": "B"}'))
+        prep = dict(phase="prep_defense", topic="T", viewpoint="V", cache_config=cache)
+        for role in ("A", "B", "A"):
+            last = await debater.run_phase(claude, role, **prep)
+        b = await debater.run_phase(claude, "B", **prep)
+        check(results, "Cache key separates roles in prep_defense",
+              len(fake_sdk.CALLS) == 3 and last["result"] == {"role": "A"}
+              and b["result"] == {"role": "B"}, f"calls={len(fake_sdk.CALLS)}")
+
+        fake_sdk.script("claude", fake_sdk.Reply('{"core_thesis": "y"}'))
+        other = await debater.run_phase(claude, "A", "initial_research", "T", "Other", cache_config=cache)
+        check(results, "Cache misses when the prompt differs",
+              not other.get("cache_hit") and other["result"] == {"core_thesis": "y"}, other)
+
+        fake_sdk.script("claude", fake_sdk.Reply('{"core_thesis": "z"}'))
+        uncached = await debater.run_phase(
+            claude, "A", "initial_research", "T", "V",
+            cache_config=debater.CacheConfig(enabled=False, directory=cache_dir)
+        )
+        check(results, "Disabled cache always calls the provider",
+              not uncached.get("cache_hit") and uncached["result"] == {"core_thesis": "z"}, uncached)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        args = ("--provider", "claude", "--role", "A", "--phase", "initial_research",
+                "--topic", "T", "--viewpoint", "V", "--skip-health-check")
+        no_cache = run_cli(cache_dir, *args, "--no-cache")
+        check(results, "--no-cache stores nothing",
+              no_cache.get("success") and not os.listdir(cache_dir), no_cache)
+        run_cli(cache_dir, *args)
+        hit = run_cli(cache_dir, *args)
+        check(results, "CLI reuses a cached research result",
+              hit.get("cache_hit") is True, hit)
+        bypass = run_cli(cache_dir, *args, "--no-cache")
+        check(results, "--no-cache bypasses a cached result",
+              bypass.get("success") and not bypass.get("cache_hit"), bypass)
+
+
+def delayed(seconds: float, reply: Any, cancelled: List[str], name: str):
+    """A scripted reply that arrives after a delay, noting if it was cancelled."""
+    async def respond(prompt: str):
+        try:
+            await asyncio.sleep(seconds)
+        except asyncio.CancelledError:
+            cancelled.append(name)
+            raise
+        if isinstance(reply, BaseException):
+            raise reply
+        return reply
+    return respond
+
+
+async def hedge_tests(debater, results: List[Tuple[str, bool, str]]) -> None:
+    codex = fake_sdk.Provider.CODEX
+    debater.RETRY_CONFIG = debater.RetryConfig(max_attempts=1)
+    options = dict(
+        fallback_config=debater.FallbackConfig(),
+        hedge_config=debater.HedgeConfig(enabled=True, hedge_after=0.05),
+        cache_config=debater.CacheConfig(enabled=False),
+    )
+
+    async def hedged(primary: Any, fallback: Any) -> Tuple[dict, List[str], float]:
+        fake_sdk.reset(debater)
+        cancelled = []
+        fake_sdk.script("codex", delayed(*primary, cancelled, "primary"))
+        fake_sdk.script("claude", delayed(*fallback, cancelled, "fallback"))
+        start = time.monotonic()
+        result = await debater.run_phase_with_fallback(codex, "A", "round_claim", "T", "V", **options)
+        return result, cancelled, time.monotonic() - start
+
+    # Fast primary: no hedge is started
+    fake_sdk.reset(debater)
+    fake_sdk.script("codex", fake_sdk.Reply('{"a": 1}'))
+    result = await debater.run_phase_with_fallback(codex, "A", "round_claim", "T", "V", **options)
+    check(results, "Primary answering before hedge_after is not hedged",
+          result["success"] and "fallback_history" not in result
+          and [p for p, _ in fake_sdk.CALLS] == ["codex"], result)
+
+    # Slow primary: the fallback answers first and the primary is cancelled
+    result, cancelled, elapsed = await hedged((5.0, fake_sdk.Reply('{"a": 1}')),
+                                               (0.0, fake_sdk.Reply('{"b": 2}')))
+    check(results, "Faster fallback wins the hedge race",
+          result["success"] and result["provider"] == "claude" and result["result"] == {"b": 2}
+          and result.get("fallback_used") and result.get("original_provider") == "codex", result)
+    check(results, "Hedge loser (primary) is cancelled",
+          cancelled == ["primary"] and elapsed < 1.0, (cancelled, elapsed))
+    history = result.get("fallback_history") or [{}]
+    check(results, "Hedge record names the winner",
+          len(history) == 1 and history[0].get("winner") == "claude"
+          and history[0].get("error_type") == "hedge"
+          and history[0].get("original_provider") == "codex"
+          and history[0].get("fallback_provider") == "claude"
+          and history[0].get("recovery_time_ms") is not None, history)
+
+    # The primary answers during the race: it wins and the fallback is cancelled
+    result, cancelled, elapsed = await hedged((0.1, fake_sdk.Reply('{"a": 1}')),
+                                               (5.0, fake_sdk.Reply('{"b": 2}')))
+    history = result.get("fallback_history") or [{}]
+    check(results, "Primary finishing first wins the hedge race",
+          result["success"] and result["provider"] == "codex" and not result.get("fallback_used")
+          and history[0].get("winner") == "codex", result)
+    check(results, "Hedge loser (fallback) is cancelled",
+          cancelled == ["fallback"] and elapsed < 1.0, (cancelled, elapsed))
+
+    # A primary error that doesn't warrant fallback ends the race at once
+    result, cancelled, elapsed = await hedged((0.1, RuntimeError("invalid request: malformed prompt")),
+                                               (5.0, fake_sdk.Reply('{"b": 2}')))
+    history = result.get("fallback_history") or [{}]
+    check(results, "Non-fallback primary error is returned without waiting for the fallback",
+          not result["success"] and result["provider"] == "codex"
+          and "malformed prompt" in result["error"] and not result.get("fallback_used")
+          and cancelled == ["fallback"] and elapsed < 1.0, (result, cancelled, elapsed))
+    check(results, "Hedge record has no winner when the primary error is returned",
+          len(history) == 1 and history[0].get("winner", "missing") is None, history)
+
+    # Both fail with recoverable errors: the fallback's failure is returned
+    result, cancelled, elapsed = await hedged((0.1, RuntimeError("429 rate limit")),
+                                               (0.2, RuntimeError("503 service unavailable")))
+    history = result.get("fallback_history") or [{}]
+    check(results, "Both hedged calls failing returns the fallback's error",
+          not result["success"] and result["provider"] == "claude"
+          and result.get("fallback_used") and "503" in result["error"]
+          and history[0].get("winner", "missing") is None and not cancelled, (result, cancelled))
+
+
+class FakeClock:
+    """A time.monotonic() stand-in that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FailedStream:
+    """A stream whose final event reports failure."""
+
+    def __init__(self, error: str):
+        self.events = ["partial", fake_sdk.Reply(success=False, error=error)]
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.events:
+            raise StopAsyncIteration
+        return self.events.pop(0)
+
+
+async def breaker_tests(debater, results: List[Tuple[str, bool, str]]) -> None:
+    clock = FakeClock()
+    config = debater.BreakerConfig(failure_threshold=3, cooldown=30.0)
+
+    breaker = debater.CircuitBreaker(config, clock=clock)
+    breaker.record_failure()
+    breaker.record_failure()
+    check(results, "Breaker stays closed below the failure threshold",
+          breaker.state == "closed" and breaker.allow(), breaker.state)
+    breaker.record_failure(recoverable=False)
+    check(results, "Non-recoverable failures don't count toward opening",
+          breaker.state == "closed" and breaker.failures == 2, breaker.failures)
+    breaker.record_failure()
+    check(results, "Breaker opens after failure_threshold failures",
+          breaker.state == "open" and not breaker.allow(), breaker.state)
+
+    clock.now += 29.0
+    check(results, "Open breaker rejects calls during the cooldown", not breaker.allow())
+    clock.now += 1.0
+    first, second = breaker.allow(), breaker.allow()
+    check(results, "After the cooldown exactly one half-open probe is let through",
+          breaker.state == "half_open" and first and not second, (first, second))
+    breaker.record_failure()
+    check(results, "Failed probe re-opens the breaker for a new cooldown",
+          breaker.state == "open" and breaker.opened_at == clock.now and not breaker.allow(),
+          breaker.state)
+    clock.now += 30.0
+    breaker.allow()
+    breaker.record_success()
+    check(results, "Successful probe closes the breaker",
+          breaker.state == "closed" and breaker.failures == 0 and breaker.allow(), breaker.state)
+
+    # execute_llm: an open circuit is not called at all
+    codex = fake_sdk.Provider.CODEX
+    fake_sdk.reset(debater)
+    breaker = debater._BREAKERS[codex] = debater.CircuitBreaker(config, clock=clock)
+    options = dict(provider=codex, timeout=5.0)
+    for _ in range(3):
+        breaker.record_failure()
+    try:
+        await debater.execute_llm(breaker, options, "p")
+        check(results, "Open circuit raises CircuitOpenError", False, "no exception raised")
+    except debater.CircuitOpenError:
+        check(results, "Open circuit raises CircuitOpenError", not fake_sdk.CALLS, fake_sdk.CALLS)
+
+    # A probe cancelled mid-call (lost hedge, phase deadline) is released
+    clock.now += 30.0
+    cancelled = []
+    fake_sdk.script("codex", delayed(5.0, fake_sdk.Reply('{"a": 1}'), cancelled, "probe"))
+    task = asyncio.ensure_future(debater.execute_llm(breaker, options, "p"))
+    await asyncio.sleep(0.05)
+    probing = breaker.probe_inflight and not breaker.allow()
+    await debater.cancel_tasks(task)
+    check(results, "Cancelled probe releases the half-open slot",
+          probing and cancelled == ["probe"] and breaker.state == "half_open"
+          and not breaker.probe_inflight and breaker.allow(), (probing, breaker.state))
+    breaker.release()
+
+    # A call that returns an unsuccessful result is a failure, not a success
+    fake_sdk.script("codex", fake_sdk.Reply("partial", success=False, error="overloaded"))
+    try:
+        await debater.execute_llm(breaker, options, "p")
+        check(results, "Unsuccessful result is recorded as a breaker failure", False, "no exception raised")
+    except debater.RetryableError as e:
+        check(results, "Unsuccessful result is recorded as a breaker failure",
+              breaker.state == "open" and str(e) == "overloaded", breaker.state)
+
+    # ...and a streamed response that fails does the same
+    fake_sdk.reset(debater, streaming=True)
+    breaker = debater._BREAKERS[codex] = debater.CircuitBreaker(config, clock=clock)
+    fake_sdk.script("codex", FailedStream("overloaded"))
+    try:
+        await debater.execute_llm(breaker, options, "p")
+    except debater.RetryableError:
+        pass
+    check(results, "Failed streamed call is recorded as a breaker failure",
+          breaker.failures == 1 and breaker.state == "closed", breaker.failures)
+
+
+async def jitter_tests(debater, results: List[Tuple[str, bool, str]]) -> None:
+    debater._RETRY_RANDOM.seed(1234)
+    bounds = {"none": (1.0, 1.0), "full": (0.0, 1.0), "equal": (0.5, 1.0)}
+    for jitter, (low, high) in bounds.items():
+        config = debater.RetryConfig(max_attempts=6, base_delay=1.0, max_delay=8.0, jitter=jitter)
+        out_of_bounds = [
+            (attempt, delay)
+            for attempt in range(1, config.max_attempts)
+            for delay in [debater.retry_delay(config, attempt) for _ in range(200)]
+            if not low * config.delays[attempt - 1] <= delay <= high * config.delays[attempt - 1]
+        ]
+        check(results, f"'{jitter}' jitter keeps delays within bounds", not out_of_bounds, out_of_bounds[:3])
+
+    config = debater.RetryConfig(max_attempts=4, base_delay=1.0, max_delay=8.0, jitter="full")
+    check(results, "Backoff is capped at max_delay", config.delays[-1] == 8.0, config.delays)
+    debater._RETRY_RANDOM.seed(99)
+    first = [debater.retry_delay(config, a) for a in range(1, 4)]
+    debater._RETRY_RANDOM.seed(99)
+    again = [debater.retry_delay(config, a) for a in range(1, 4)]
+    check(results, "Jitter is reproducible under a fixed seed", first == again, (first, again))
+
+    # Jittered retries never sleep past the deadline
+    debater._RETRY_RANDOM.seed(7)
+    config = debater.RetryConfig(max_attempts=10, base_delay=0.05, max_delay=1.0, jitter="equal")
+    calls = []
+
+    async def attempt():
+        calls.append(time.monotonic())
+        raise debater.RetryableError("busy")
+
+    start = time.monotonic()
+    try:
+        await debater.with_retry(attempt, config=config, deadline=start + 0.5)
+    except debater.RetryableError:
+        pass
+    elapsed = time.monotonic() - start
+    check(results, "Jittered retries stay under the deadline",
+          1 < len(calls) < config.max_attempts and elapsed < 0.5, (len(calls), elapsed))
+
+
+async def deadline_tests(debater, results: List[Tuple[str, bool, str]]) -> None:
+    config = debater.RetryConfig(max_attempts=5, base_delay=0.2, max_delay=1.0, jitter="none")
+
+    def failing(calls: List[float]):
+        async def attempt():
+            calls.append(time.monotonic())
+            raise debater.RetryableError(f"attempt {len(calls)} failed")
+        return attempt
+
+    calls, retries = [], []
+    start = time.monotonic()
+    try:
+        await debater.with_retry(failing(calls), config=config, deadline=start + 0.3,
+                                 on_retry=lambda attempt, e: retries.append(attempt))
+        check(results, "Backoff that would cross the deadline is skipped", False, "no exception raised")
+    except debater.RetryableError as e:
+        elapsed = time.monotonic() - start
+        # Attempt 1, a 0.2s backoff, attempt 2; the 0.4s backoff would end past 0.3s
+        check(results, "Backoff that would cross the deadline is skipped",
+              len(calls) == 2 and retries == [1] and elapsed < 0.3, (len(calls), elapsed))
+        check(results, "Deadline stop re-raises the last attempt's error",
+              str(e) == "attempt 2 failed", e)
+
+    calls = []
+    try:
+        await debater.with_retry(failing(calls), config=config, deadline=time.monotonic() - 1)
+        check(results, "No attempt starts after the deadline", False, "no exception raised")
+    except asyncio.TimeoutError:
+        check(results, "No attempt starts after the deadline", not calls, len(calls))
+
+    # execute_llm clips its attempt timeout to the phase deadline
+    codex = fake_sdk.Provider.CODEX
+    fake_sdk.reset(debater)
+    cancelled = []
+    fake_sdk.script("codex", delayed(5.0, fake_sdk.Reply('{"a": 1}'), cancelled, "attempt"))
+    breaker = debater.get_breaker(codex)
+    start = time.monotonic()
+    try:
+        await debater.execute_llm(breaker, dict(provider=codex, timeout=5.0), "p", start + 0.1)
+        check(results, "Attempt timeout is clipped to the deadline", False, "no exception raised")
+    except asyncio.TimeoutError:
+        elapsed = time.monotonic() - start
+        check(results, "Attempt timeout is clipped to the deadline",
+              elapsed < 1.0 and cancelled == ["attempt"], elapsed)
+
+    # run_phase reports the phase timeout, whichever attempt ran into it
+    debater.RETRY_CONFIG = debater.RetryConfig(max_attempts=3, base_delay=0.01, jitter="none")
+    debater.TIMEOUT_CONFIG = debater.TimeoutConfig(round_claim=0.2)
+    fake_sdk.reset(debater)
+    fake_sdk.script("codex", delayed(5.0, fake_sdk.Reply('{"a": 1}'), cancelled, "phase"))
+    start = time.monotonic()
+    result = await debater.run_phase(codex, "A", "round_claim", "T", "V",
+                                     cache_config=debater.CacheConfig(enabled=False))
+    elapsed = time.monotonic() - start
+    check(results, "Phase timeout is reported as 'Timeout after {timeout}s'",
+          not result["success"] and result["error"] == "Timeout after 0.2s"
+          and result["error_type"] == "timeout" and result["error_category"] == "timeout",
+          result)
+    check(results, "Phase timeout bounds the whole phase, retries included",
+          elapsed < 1.0 and len(fake_sdk.CALLS) == 1, (elapsed, len(fake_sdk.CALLS)))
+    debater.TIMEOUT_CONFIG = debater.TimeoutConfig()
+
+
+async def batch_tests(debater, results: List[Tuple[str, bool, str]]) -> None:
+    os.environ.setdefault("ANTHROPIC_API_KEY", "test")
+    os.environ.setdefault("OPENAI_API_KEY", "test")
+    fallback = debater.FallbackConfig()
+    no_cache = debater.CacheConfig(enabled=False)
+    spec = dict(provider="claude", role="A", phase="round_claim", topic="T", viewpoint="V")
+
+    fake_sdk.reset(debater)
+    cancelled = []
+    fake_sdk.script("claude", delayed(0.2, fake_sdk.Reply('{"n": 1}'), cancelled, "one"),
+                    delayed(0.2, fake_sdk.Reply('{"n": 2}'), cancelled, "two"))
+    specs = [
+        spec,
+        dict(spec, role="B", round=2, speaker_order=2),
+        ["not", "an", "object"],
+        dict(spec, topic=""),
+        dict(spec, provider="mistral"),
+        dict(spec, round="second"),
+    ]
+    start = time.monotonic()
+    batch = await debater.run_batch(specs, fallback, skip_health_check=True, cache_config=no_cache)
+    elapsed = time.monotonic() - start
+    check(results, "Batch returns one result per spec, in order",
+          len(batch) == len(specs) and [r.get("role") for r in batch[:2]] == ["A", "B"]
+          and batch[1]["round"] == 2, batch)
+    check(results, "Batch runs its phases concurrently",
+          batch[0]["success"] and batch[1]["success"] and elapsed < 0.35, elapsed)
+    check(results, "Batch passes spec fields through to the prompt",
+          any("Debater B" in prompt for _, prompt in fake_sdk.CALLS), len(fake_sdk.CALLS))
+    check(results, "Non-object batch entry is rejected",
+          batch[2] == {"success": False, "error": "Batch entry must be a JSON object",
+                       "error_type": "invalid_input"}, batch[2])
+    check(results, "Batch entry missing fields is rejected",
+          batch[3].get("error") == "Missing required fields: topic", batch[3])
+    check(results, "Batch entry for a provider without an API key is rejected",
+          batch[4].get("error_type") == "api_key_missing", batch[4])
+    check(results, "Batch entry that raises becomes an error result",
+          batch[5].get("success") is False and batch[5].get("error_type") == "ValueError", batch[5])
+
+    # An unavailable provider falls back before the phase, as on the CLI
+    fake_sdk.reset(debater)
+    fake_sdk.script("claude", fake_sdk.Reply('{"n": 3}'))
+    down = debater.ProviderStatus(provider="codex", available=False, error="503 down",
+                                  error_type="service_unavailable")
+    result = await debater.run_batch_spec(dict(spec, provider="codex"), fallback, {"codex": down},
+                                          no_cache)
+    check(results, "Batch entry for an unavailable provider uses the fallback",
+          result["success"] and result["provider"] == "claude"
+          and result["pre_debate_fallback"]["original_provider"] == "codex", result)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        out = run_cli(cache_dir, "--batch", "--skip-health-check",
+                      stdin=json.dumps([spec, {"provider": "claude"}]).encode())
+        check(results, "--batch reads specs from stdin and writes a result array",
+              isinstance(out, list) and len(out) == 2 and out[0].get("success")
+              and out[1].get("error_type") == "invalid_input", out)
+        out = run_cli(cache_dir, "--batch", stdin=b"[not json")
+        check(results, "--batch rejects invalid JSON input",
+              out.get("returncode") == 1
+              and out["output"]["error"].startswith("Invalid batch input"), out)
+        out = run_cli(cache_dir, "--batch", stdin=json.dumps(spec).encode())
+        check(results, "--batch rejects input that is not an array",
+              out.get("returncode") == 1
+              and out["output"]["error"] == "Batch input must be a JSON array of phase specs", out)
+
+
+async def run_tests(debater) -> List[Tuple[str, bool, str]]:
+    results = []
+    await breaker_tests(debater, results)
+    await jitter_tests(debater, results)
+    await deadline_tests(debater, results)
+    await cache_tests(debater, results)
+    await hedge_tests(debater, results)
+    await batch_tests(debater, results)
+    return results
+
+
+def main():
+    """Run debater tests."""
+    print("=" * 60)
+    print("Philosopher Plugin Debater Test Runner")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # Keep health and result caches written by the tests out of ~/.cache
+        os.environ["DEBATE_CACHE_DIR"] = cache_dir
+        results = asyncio.run(run_tests(load_debater()))
+    failed = 0
+    for name, ok, detail in results:
+        if ok:
+            print(f"  {GREEN}[PASS]{RESET} {name}")
+        else:
+            failed += 1
+            print(f"  {RED}[FAIL]{RESET} {name}: {detail}")
+
+    print(f"\n{'=' * 60}")
+    print(f"Debater Test Results: {len(results) - failed}/{len(results)} passed")
+    if failed:
+        print(f"\n{RED}Some tests failed!{RESET}")
+    else:
+        print(f"\n{GREEN}All debater tests passed!{RESET}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,48 @@
 Philosopher Plugin E2E Test Runner
 
 Tests end-to-end functionality of hooks and script integration.
-Run with: python3 tests/e2e-test-runner.py
+Run with: python3 tests/e2e-test-runner.py [--quiet]
 """
 
-import os
 import sys
 import json
 import subprocess
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to stdlib json
+    orjson = None
+
+# Reused across calls instead of the per-call default behind json.loads
+_DECODER = json.JSONDecoder()
+_WHITESPACE = json.decoder.WHITESPACE
+
+
+def dump_json(obj: Any) -> bytes:
+    """Serialize obj straight to UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def parse_hook_output(data: bytes) -> Any:
+    """Parse a hook's raw stdout in one pass; None if it printed nothing.
+
+    Like json.loads, raises JSONDecodeError on anything after the document.
+    """
+    if not data.strip(b" \t\n\r"):
+        return None
+    if orjson is not None:
+        return orjson.loads(data)
+    text = data.decode("utf-8", "replace")
+    obj, end = _DECODER.raw_decode(text, _WHITESPACE.match(text, 0).end())
+    end = _WHITESPACE.match(text, end).end()
+    if end != len(text):
+        raise json.JSONDecodeError("Extra data", text, end)
+    return obj
+
 
 # Colors for output
 GREEN = "\033[92m"
@@ -19,255 +52,192 @@ RED = "\033[91m"
 YELLOW = "\033[93m"
 RESET = "\033[0m"
 
-
-def get_plugin_root() -> Path:
-    """Get the plugin root directory."""
-    return Path(__file__).parent.parent
+# Test outcomes
+PASS = "PASS"
+FAIL = "FAIL"
+SKIP = "SKIP"
+
+STATUS_COLORS = {PASS: GREEN, FAIL: RED, SKIP: YELLOW}
+
+HOOK_TIMEOUT = 10  # seconds per hook invocation
+
+
+# Plugin root (this file lives in tests/), resolved once for every test
+PLUGIN_ROOT = Path(__file__).resolve().parent.parent
+
+
+class HookError(Exception):
+    """A hook script could not be run or produced unparseable output."""
+
+
+class E2ECase(NamedTuple):
+    """One hook invocation and the decision it should produce."""
+
+    description: str
+    hook: str
+    payload: bytes  # hook stdin, encoded once at import
+    expected: Optional[str]  # None: any outcome passes
+    pass_msg: str
+    fail_msg: str = ""
+
+
+DEBATER_COMMAND = "python3 scripts/multi_llm_debater.py"
+
+CASES = [
+    E2ECase(
+        "validate_debate_topic with good technical topic",
+        "validate_debate_topic.py",
+        dump_json({"tool_name": "Skill",
+                   "tool_input": {"skill": "debate-multiverse", "args": "React vs Vue for our frontend project"}}),
+        "allow", "Good topic allowed", "Good topic should be allowed",
+    ),
+    E2ECase(
+        "validate_debate_topic with vague topic",
+        "validate_debate_topic.py",
+        dump_json({"tool_name": "Skill", "tool_input": {"skill": "debate", "args": "AI"}}),  # Too vague
+        "block", "Vague topic blocked correctly", "Vague topic should be blocked",
+    ),
+    E2ECase(
+        "validate_debate_topic with non-debate skill",
+        "validate_debate_topic.py",
+        dump_json({"tool_name": "Skill", "tool_input": {"skill": "some-other-skill", "args": "whatever"}}),
+        "allow", "Non-debate skill allowed", "Non-debate skill should be allowed",
+    ),
+    E2ECase(
+        "validate_debate_args with valid arguments",
+        "validate_debate_args.py",
+        dump_json({"tool_name": "Bash",
+                   "tool_input": {"command": f"{DEBATER_COMMAND} --provider claude --phase round_claim --topic 'AI ethics' --role A"}}),
+        "allow", "Valid arguments allowed", "Valid arguments should be allowed",
+    ),
+    E2ECase(
+        "validate_debate_args with missing provider",
+        "validate_debate_args.py",
+        dump_json({"tool_name": "Bash",
+                   "tool_input": {"command": f"{DEBATER_COMMAND} --phase round_claim --topic 'AI ethics'"}}),
+        "block", "Missing provider blocked correctly", "Missing provider should be blocked",
+    ),
+    # Non-debater commands exit early with code 0 (no output); this is expected
+    E2ECase(
+        "validate_debate_args with non-debater command",
+        "validate_debate_args.py",
+        dump_json({"tool_name": "Bash", "tool_input": {"command": "ls -la"}}),
+        None, "Non-debater command handled correctly (exits early)",
+    ),
+    # PostToolUse hooks always allow, but may warn
+    E2ECase(
+        "validate_debate_output with valid output",
+        "validate_debate_output.py",
+        dump_json({"tool_name": "Bash",
+                   "tool_input": {"command": f"{DEBATER_COMMAND} --provider claude --phase round_claim --topic 'AI ethics'"},
+                   "tool_output": {"stdout": json.dumps({
+                       "claim": "AI needs ethical guidelines",
+                       "evidence": ["Research shows...", "Studies indicate..."],
+                       "confidence": 0.85,
+                   })}}),
+        "allow", "Valid output allowed", "Valid output should be allowed",
+    ),
+    E2ECase(
+        "validate_debate_output with batch output",
+        "validate_debate_output.py",
+        dump_json({"tool_name": "Bash",
+                   "tool_input": {"command": f"{DEBATER_COMMAND} --batch"},
+                   "tool_output": {"stdout": json.dumps([
+                       {"success": True, "role": "A", "result": {"claim": "AI needs ethical guidelines"}},
+                       {"success": False, "role": "B", "error": "Timeout after 90.0s"},
+                   ], indent=2)}}),
+        "allow", "Batch output allowed", "Batch output should be allowed",
+    ),
+]
 
 
 class E2ETestRunner:
     """End-to-end test runner for philosopher plugin."""
 
-    def __init__(self):
-        self.root = get_plugin_root()
+    def __init__(self, quiet: bool = False):
+        self.root = PLUGIN_ROOT
         self.passed = 0
         self.failed = 0
         self.skipped = 0
+        # Report lines, written in one go; with quiet only the summary is shown
+        self.quiet = quiet
+        self._log: List[str] = []
 
-    def run_hook(self, hook_script: str, input_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Run a hook script with given input and return output."""
+    def run_hook(self, hook_script: str, payload: bytes) -> Optional[Dict[str, Any]]:
+        """Run a hook script with the given encoded stdin and return its output."""
         script_path = self.root / "hooks" / hook_script
 
         if not script_path.exists():
             return None
 
+        # Run the hook the way hooks.json does: its own interpreter, real
+        # stdio, script as __main__
         try:
             result = subprocess.run(
-                ["python3", str(script_path)],
-                input=json.dumps(input_data),
+                [sys.executable, str(script_path)],
+                input=payload,
                 capture_output=True,
-                text=True,
-                timeout=10
+                timeout=HOOK_TIMEOUT
             )
+            return parse_hook_output(result.stdout)
+        except (subprocess.TimeoutExpired, json.JSONDecodeError, OSError) as e:
+            raise HookError(f"Hook execution failed: {e}") from e
 
-            if result.stdout.strip():
-                return json.loads(result.stdout.strip())
-            return None
-
-        except (subprocess.TimeoutExpired, json.JSONDecodeError, Exception) as e:
-            print(f"  {YELLOW}[ERROR]{RESET} Hook execution failed: {e}")
-            return None
-
-    def test_validate_debate_topic_good_topic(self):
-        """Test that a good technical topic passes validation."""
-        print("\n[E2E] Testing validate_debate_topic with good technical topic...")
-
-        input_data = {
-            "tool_name": "Skill",
-            "tool_input": {
-                "skill": "debate-multiverse",
-                "args": "React vs Vue for our frontend project"
-            }
-        }
-
-        result = self.run_hook("validate_debate_topic.py", input_data)
-
-        if result is None:
-            print(f"  {YELLOW}[SKIP]{RESET} Hook did not return valid output")
-            self.skipped += 1
-            return
-
-        if result.get("decision") == "allow":
-            print(f"  {GREEN}[PASS]{RESET} Good topic allowed")
-            self.passed += 1
-        else:
-            print(f"  {RED}[FAIL]{RESET} Good topic should be allowed, got: {result}")
-            self.failed += 1
-
-    def test_validate_debate_topic_bad_topic(self):
-        """Test that a vague topic is blocked."""
-        print("\n[E2E] Testing validate_debate_topic with vague topic...")
-
-        input_data = {
-            "tool_name": "Skill",
-            "tool_input": {
-                "skill": "debate",
-                "args": "AI"  # Too vague
-            }
-        }
-
-        result = self.run_hook("validate_debate_topic.py", input_data)
-
-        if result is None:
-            print(f"  {YELLOW}[SKIP]{RESET} Hook did not return valid output")
-            self.skipped += 1
-            return
-
-        if result.get("decision") == "block":
-            print(f"  {GREEN}[PASS]{RESET} Vague topic blocked correctly")
-            self.passed += 1
-        else:
-            print(f"  {RED}[FAIL]{RESET} Vague topic should be blocked, got: {result}")
-            self.failed += 1
-
-    def test_validate_debate_topic_non_debate_skill(self):
-        """Test that non-debate skills are allowed through."""
-        print("\n[E2E] Testing validate_debate_topic with non-debate skill...")
-
-        input_data = {
-            "tool_name": "Skill",
-            "tool_input": {
-                "skill": "some-other-skill",
-                "args": "whatever"
-            }
-        }
-
-        result = self.run_hook("validate_debate_topic.py", input_data)
-
-        if result is None:
-            print(f"  {YELLOW}[SKIP]{RESET} Hook did not return valid output")
-            self.skipped += 1
-            return
-
-        if result.get("decision") == "allow":
-            print(f"  {GREEN}[PASS]{RESET} Non-debate skill allowed")
-            self.passed += 1
-        else:
-            print(f"  {RED}[FAIL]{RESET} Non-debate skill should be allowed, got: {result}")
-            self.failed += 1
-
-    def test_validate_debate_args_valid(self):
-        """Test that valid debate arguments pass."""
-        print("\n[E2E] Testing validate_debate_args with valid arguments...")
-
-        input_data = {
-            "tool_name": "Bash",
-            "tool_input": {
-                "command": "python3 scripts/multi_llm_debater.py --provider claude --phase round_claim --topic 'AI ethics' --role A"
-            }
-        }
-
-        result = self.run_hook("validate_debate_args.py", input_data)
-
-        if result is None:
-            print(f"  {YELLOW}[SKIP]{RESET} Hook did not return valid output")
-            self.skipped += 1
-            return
-
-        if result.get("decision") == "allow":
-            print(f"  {GREEN}[PASS]{RESET} Valid arguments allowed")
-            self.passed += 1
-        else:
-            print(f"  {RED}[FAIL]{RESET} Valid arguments should be allowed, got: {result}")
-            self.failed += 1
-
-    def test_validate_debate_args_missing_provider(self):
-        """Test that missing provider is blocked."""
-        print("\n[E2E] Testing validate_debate_args with missing provider...")
-
-        input_data = {
-            "tool_name": "Bash",
-            "tool_input": {
-                "command": "python3 scripts/multi_llm_debater.py --phase round_claim --topic 'AI ethics'"
-            }
-        }
-
-        result = self.run_hook("validate_debate_args.py", input_data)
-
-        if result is None:
-            print(f"  {YELLOW}[SKIP]{RESET} Hook did not return valid output")
-            self.skipped += 1
-            return
-
-        if result.get("decision") == "block":
-            print(f"  {GREEN}[PASS]{RESET} Missing provider blocked correctly")
-            self.passed += 1
-        else:
-            print(f"  {RED}[FAIL]{RESET} Missing provider should be blocked, got: {result}")
-            self.failed += 1
-
-    def test_validate_debate_args_non_debater_command(self):
-        """Test that non-debater commands are allowed through."""
-        print("\n[E2E] Testing validate_debate_args with non-debater command...")
-
-        input_data = {
-            "tool_name": "Bash",
-            "tool_input": {
-                "command": "ls -la"
-            }
-        }
-
-        result = self.run_hook("validate_debate_args.py", input_data)
-
-        # Non-debater commands exit early with code 0 (no output)
-        # This is expected behavior
-        print(f"  {GREEN}[PASS]{RESET} Non-debater command handled correctly (exits early)")
-        self.passed += 1
-
-    def test_validate_debate_output_valid(self):
-        """Test that valid output passes."""
-        print("\n[E2E] Testing validate_debate_output with valid output...")
-
-        input_data = {
-            "tool_name": "Bash",
-            "tool_input": {
-                "command": "python3 scripts/multi_llm_debater.py --provider claude --phase round_claim --topic 'AI ethics'"
-            },
-            "tool_output": {
-                "stdout": json.dumps({
-                    "claim": "AI needs ethical guidelines",
-                    "evidence": ["Research shows...", "Studies indicate..."],
-                    "confidence": 0.85
-                })
-            }
-        }
-
-        result = self.run_hook("validate_debate_output.py", input_data)
-
-        if result is None:
-            print(f"  {YELLOW}[SKIP]{RESET} Hook did not return valid output")
-            self.skipped += 1
-            return
-
-        # PostToolUse hooks always allow, but may warn
-        if result.get("decision") == "allow":
-            print(f"  {GREEN}[PASS]{RESET} Valid output allowed")
-            self.passed += 1
+    def run_case(self, case: E2ECase) -> Tuple[List[str], str]:
+        """Run one case against its hook and return its report lines and status."""
+        lines = [f"\n[E2E] Testing {case.description}..."]
+        try:
+            result = self.run_hook(case.hook, case.payload)
+        except HookError as e:
+            lines.append(f"  {YELLOW}[ERROR]{RESET} {e}")
+            result = None
+
+        if case.expected is None:
+            status, message = PASS, case.pass_msg
+        elif result is None:
+            status, message = SKIP, "Hook did not return valid output"
+        elif result.get("decision") == case.expected:
+            status, message = PASS, case.pass_msg
         else:
-            print(f"  {RED}[FAIL]{RESET} Valid output should be allowed, got: {result}")
-            self.failed += 1
+            status, message = FAIL, f"{case.fail_msg}, got: {result}"
+        lines.append(f"  {STATUS_COLORS[status]}[{status}]{RESET} {message}")
+        return lines, status
 
     def run_all_tests(self) -> bool:
         """Run all E2E tests and return success status."""
-        print("="*60)
-        print("Philosopher Plugin E2E Test Runner")
-        print("="*60)
-
-        # Run all test methods
-        self.test_validate_debate_topic_good_topic()
-        self.test_validate_debate_topic_bad_topic()
-        self.test_validate_debate_topic_non_debate_skill()
-        self.test_validate_debate_args_valid()
-        self.test_validate_debate_args_missing_provider()
-        self.test_validate_debate_args_non_debater_command()
-        self.test_validate_debate_output_valid()
+        log = self._log
+        if not self.quiet:
+            log += ["="*60, "Philosopher Plugin E2E Test Runner", "="*60]
+
+        for case in CASES:
+            lines, status = self.run_case(case)
+            if not self.quiet:
+                log += lines
+            if status == PASS:
+                self.passed += 1
+            elif status == FAIL:
+                self.failed += 1
+            else:
+                self.skipped += 1
 
         # Summary
         total = self.passed + self.failed + self.skipped
-        print(f"\n{'='*60}")
-        print(f"E2E Test Results: {self.passed}/{total} passed, {self.failed} failed, {self.skipped} skipped")
+        log.append(f"\n{'='*60}")
+        log.append(f"E2E Test Results: {self.passed}/{total} passed, {self.failed} failed, {self.skipped} skipped")
 
         if self.failed > 0:
-            print(f"\n{RED}Some tests failed!{RESET}")
-            return False
+            log.append(f"\n{RED}Some tests failed!{RESET}")
+        else:
+            log.append(f"\n{GREEN}All E2E tests passed!{RESET}")
 
-        print(f"\n{GREEN}All E2E tests passed!{RESET}")
-        return True
+        sys.stdout.write("\n".join(log) + "\n")
+        log.clear()
+        return self.failed == 0
 
 
 def main():
     """Run E2E tests."""
-    runner = E2ETestRunner()
+    runner = E2ETestRunner(quiet="--quiet" in sys.argv[1:])
     success = runner.run_all_tests()
     sys.exit(0 if success else 1)
 
@@ -0,0 +1,128 @@
+"""
+Fake u-llm-sdk for the test runners.
+
+install() registers stand-in u_llm_sdk and llm_types modules and loads
+them into multi_llm_debater, so debate phases run without the SDK or any
+API access. Each provider answers from a queue of scripted replies:
+
+    fake_sdk.script("codex", RuntimeError("429 rate limit"), Reply('{"a": 1}'))
+
+A queued item is a Reply (returned by run()), an exception (raised), an
+async iterator (returned by stream(); requires streaming=True), or a
+coroutine function (awaited with the prompt, e.g. to hang or sleep).
+"""
+
+import enum
+import sys
+import types
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class Provider(enum.Enum):
+    CLAUDE = "claude"
+    CODEX = "codex"
+    GEMINI = "gemini"
+
+
+class ModelTier(enum.Enum):
+    LOW = "low"
+    HIGH = "high"
+
+
+class AutoApproval(enum.Enum):
+    NONE = "none"
+    FULL = "full"
+
+
+class ReasoningLevel(enum.Enum):
+    HIGH = "high"
+
+
+class LLMConfig:
+    def __init__(self, **options):
+        self.__dict__.update(options)
+
+
+class Reply:
+    """A result shaped like the SDK's llm.run() result."""
+
+    def __init__(self, text: str = "", success: bool = True, error: Optional[str] = None,
+                 session_id: Optional[str] = "sess-fake"):
+        self.text = text
+        self.success = success
+        self.error = error
+        self.session_id = session_id
+
+
+# Scripted replies per provider value, and every (provider, prompt) served
+REPLIES: Dict[str, List[Any]] = {}
+CALLS: List[Tuple[str, str]] = []
+# Clients expose stream() only while this is set
+STREAMING = False
+
+
+def script(provider: str, *replies: Any) -> None:
+    """Queue replies for a provider, after any still queued."""
+    REPLIES.setdefault(provider, []).extend(replies)
+
+
+def next_reply(provider: str, prompt: str) -> Any:
+    CALLS.append((provider, prompt))
+    queue = REPLIES.get(provider)
+    if not queue:
+        raise AssertionError(f"No scripted reply left for {provider}")
+    reply = queue.pop(0)
+    if isinstance(reply, BaseException):
+        raise reply
+    return reply
+
+
+class LLM:
+    def __init__(self, config: LLMConfig):
+        self.config = config
+        self.closed = False
+        if STREAMING:
+            self.stream = self._stream
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+        return False
+
+    async def run(self, prompt: str) -> Reply:
+        reply = next_reply(self.config.provider.value, prompt)
+        if callable(reply):
+            reply = await reply(prompt)
+        return reply
+
+    def _stream(self, prompt: str) -> Any:
+        return next_reply(self.config.provider.value, prompt)
+
+
+def register() -> None:
+    """Make the fake SDK importable as u_llm_sdk and llm_types."""
+    sdk = types.ModuleType("u_llm_sdk")
+    sdk.LLM, sdk.LLMConfig = LLM, LLMConfig
+    llm_types = types.ModuleType("llm_types")
+    llm_types.Provider, llm_types.ModelTier = Provider, ModelTier
+    llm_types.AutoApproval, llm_types.ReasoningLevel = AutoApproval, ReasoningLevel
+    sys.modules["u_llm_sdk"] = sdk
+    sys.modules["llm_types"] = llm_types
+
+
+def install(debater) -> None:
+    """Register the fake SDK modules and bind them into the debater module."""
+    register()
+    debater.load_sdk()
+
+
+def reset(debater, streaming: bool = False) -> None:
+    """Forget scripted replies, calls, pooled clients and breaker state."""
+    global STREAMING
+    STREAMING = streaming
+    REPLIES.clear()
+    CALLS.clear()
+    debater._LLM_POOL.clear()
+    debater._BREAKERS.clear()
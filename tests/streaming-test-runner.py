@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Philosopher Plugin Streaming Test Runner
+
+Tests multi_llm_debater.run_llm against fake streaming LLM clients, and
+run_phase end to end on the fake SDK in tests/fake_sdk.py.
+Run with: python3 tests/streaming-test-runner.py
+"""
+
+import asyncio
+import importlib.util
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+# Colors for output
+GREEN = "\033[92m"
+RED = "\033[91m"
+RESET = "\033[0m"
+
+PLUGIN_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import fake_sdk  # noqa: E402
+
+
+def load_debater():
+    """Import scripts/multi_llm_debater.py (the SDK itself is not needed)."""
+    path = PLUGIN_ROOT / "scripts" / "multi_llm_debater.py"
+    spec = importlib.util.spec_from_file_location("multi_llm_debater", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class Chunk:
+    """A streamed text event, optionally carrying the session id."""
+
+    def __init__(self, text: str, session_id: Optional[str] = None):
+        self.text = text
+        self.session_id = session_id
+
+
+class FinalResult:
+    """The result object a stream ends with, shaped like llm.run()'s."""
+
+    def __init__(self, success: bool, text: str = "", error: Optional[str] = None,
+                 session_id: Optional[str] = "sess-final"):
+        self.success = success
+        self.text = text
+        self.error = error
+        self.session_id = session_id
+
+
+class FakeStream:
+    """Async iterator over scripted events; records how far it was read."""
+
+    def __init__(self, events: List[Any], error: Optional[Exception] = None):
+        self.events = events
+        self.error = error
+        self.consumed = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.consumed == len(self.events):
+            if self.error is not None:
+                raise self.error
+            raise StopAsyncIteration
+        event = self.events[self.consumed]
+        self.consumed += 1
+        return event
+
+    async def aclose(self):
+        self.closed = True
+
+
+class FakeStreamingLLM:
+    """Client exposing stream(); run() must not be used when it exists."""
+
+    def __init__(self, stream: FakeStream):
+        self._stream = stream
+
+    def stream(self, prompt: str) -> FakeStream:
+        return self._stream
+
+    async def run(self, prompt: str):
+        raise AssertionError("run() called on a streaming client")
+
+
+def check(results: List[Tuple[str, bool, str]], name: str, ok: bool, detail: Any = ""):
+    results.append((name, ok, str(detail)))
+
+
+async def run_tests(debater) -> List[Tuple[str, bool, str]]:
+    results = []
+
+    # Early exit: stop at the end of the JSON object, keep the session id
+    stream = FakeStream([
+        Chunk('{"claim": "a', session_id="sess-1"),
+        Chunk('b", "n": {"x": 1}}'),
+        Chunk(" trailing prose that is never read"),
+        FinalResult(True),
+    ])
+    result = await debater.run_llm(FakeStreamingLLM(stream), "p")
+    check(results, "Complete JSON object closes the stream early",
+          stream.consumed == 2 and stream.closed, f"consumed={stream.consumed}")
+    check(results, "Early exit keeps the streamed session id",
+          result.session_id == "sess-1", result.session_id)
+    check(results, "Early exit counts as success",
+          result.success and result.error is None, (result.success, result.error))
+    check(results, "Early exit returns just the object text",
+          result.text == '{"claim": "ab", "n": {"x": 1}}', result.text)
+
+    # Prose first: read to the final result, which is authoritative
+    stream = FakeStream([Chunk("Here is my answer: "), Chunk('{"a": 1}'), FinalResult(True)])
+    result = await debater.run_llm(FakeStreamingLLM(stream), "p")
+    check(results, "Final result supplies session id and success",
+          result.session_id == "sess-final" and result.success, (result.session_id, result.success))
+    check(results, "Streamed text is joined in order",
+          result.text == 'Here is my answer: {"a": 1}', result.text)
+
+    # Final result reporting an error
+    stream = FakeStream([Chunk("partial"), FinalResult(False, error="overloaded")])
+    result = await debater.run_llm(FakeStreamingLLM(stream), "p")
+    check(results, "Failed final result is reported as failure",
+          not result.success and result.error == "overloaded", (result.success, result.error))
+
+    # Stream that ends without a final result or a complete object
+    stream = FakeStream([Chunk('{"claim": "trunc')])
+    result = await debater.run_llm(FakeStreamingLLM(stream), "p")
+    check(results, "Truncated stream is reported as failure",
+          not result.success and result.error, (result.success, result.error))
+
+    # Final result that carries the whole text without chunks
+    stream = FakeStream([FinalResult(True, text='{"a": 1}')])
+    result = await debater.run_llm(FakeStreamingLLM(stream), "p")
+    check(results, "Text-only final result is used as the response",
+          result.text == '{"a": 1}' and result.success, result.text)
+
+    # Errors raised by the stream propagate (so with_retry sees them) and close it
+    stream = FakeStream([Chunk("{")], error=RuntimeError("connection reset"))
+    try:
+        await debater.run_llm(FakeStreamingLLM(stream), "p")
+        check(results, "Stream errors propagate and close the stream", False, "no exception raised")
+    except RuntimeError:
+        check(results, "Stream errors propagate and close the stream", stream.closed)
+
+    return results
+
+
+async def run_phase_tests(debater, cache_dir: str) -> List[Tuple[str, bool, str]]:
+    """Drive streamed responses through run_phase (retry, breaker, cache, fallback)."""
+    results = []
+    fake_sdk.install(debater)
+    debater.RETRY_CONFIG = debater.RetryConfig(max_attempts=2, base_delay=0.01, jitter="none")
+    cache = debater.CacheConfig(directory=cache_dir)
+    codex = fake_sdk.Provider.CODEX
+
+    # A streamed object is parsed, cached and keeps its session id
+    fake_sdk.reset(debater, streaming=True)
+    stream = FakeStream([Chunk('{"core_thesis": "x"}', session_id="sess-1"), Chunk(" prose")])
+    fake_sdk.script("codex", stream)
+    response = await debater.run_phase(codex, "A", "initial_research", "T1", "V", cache_config=cache)
+    check(results, "run_phase parses a streamed response",
+          response["success"] and response["result"] == {"core_thesis": "x"}
+          and response["session_id"] == "sess-1" and stream.closed, response)
+    check(results, "run_phase caches a successful streamed response",
+          len(os.listdir(cache_dir)) == 1, os.listdir(cache_dir))
+
+    # A failed final result is retried, counted by the breaker and not cached
+    fake_sdk.reset(debater, streaming=True)
+    fake_sdk.script("codex",
+                    FakeStream([Chunk("partial"), FinalResult(False, error="overloaded")]),
+                    FakeStream([Chunk("partial"), FinalResult(False, error="overloaded")]))
+    response = await debater.run_phase(codex, "A", "initial_research", "T2", "V", cache_config=cache)
+    check(results, "Failed stream fails the phase with its error",
+          not response["success"] and response["error"] == "overloaded"
+          and response["error_category"] == "overloaded", response)
+    check(results, "Failed stream is retried",
+          len(fake_sdk.CALLS) == 2 and len(response["retry_history"]) == 1, fake_sdk.CALLS)
+    breaker = debater.get_breaker(codex)
+    check(results, "Failed stream is recorded as a breaker failure",
+          breaker.failures == 2, breaker.failures)
+    check(results, "Failed stream is not cached",
+          len(os.listdir(cache_dir)) == 1, os.listdir(cache_dir))
+
+    # A stream truncated on one attempt succeeds on the retry
+    fake_sdk.reset(debater, streaming=True)
+    fake_sdk.script("codex", FakeStream([Chunk('{"core_thesis": "tr')]),
+                    FakeStream([Chunk('{"core_thesis": "y"}')]))
+    response = await debater.run_phase(codex, "A", "round_claim", "T3", "V", cache_config=cache)
+    check(results, "Truncated stream is retried to success",
+          response["success"] and response["result"] == {"core_thesis": "y"}
+          and len(response["retry_history"]) == 1, response)
+
+    # Recoverable stream failures fall back to the fallback provider
+    fake_sdk.reset(debater, streaming=True)
+    fake_sdk.script("codex",
+                    FakeStream([FinalResult(False, error="503 service unavailable")]),
+                    FakeStream([FinalResult(False, error="503 service unavailable")]))
+    fake_sdk.script("claude", FakeStream([Chunk('{"a": 1}')]))
+    response = await debater.run_phase_with_fallback(
+        codex, "A", "round_claim", "T4", "V", cache_config=cache,
+        hedge_config=debater.HedgeConfig(enabled=False)
+    )
+    check(results, "Failed stream falls back to another provider",
+          response["success"] and response.get("fallback_used")
+          and response["provider"] == "claude", response)
+
+    return results
+
+
+def main():
+    """Run streaming tests."""
+    print("=" * 60)
+    print("Philosopher Plugin Streaming Test Runner")
+    print("=" * 60)
+
+    debater = load_debater()
+    results = asyncio.run(run_tests(debater))
+    with tempfile.TemporaryDirectory() as cache_dir:
+        results += asyncio.run(run_phase_tests(debater, cache_dir))
+    failed = 0
+    for name, ok, detail in results:
+        if ok:
+            print(f"  {GREEN}[PASS]{RESET} {name}")
+        else:
+            failed += 1
+            print(f"  {RED}[FAIL]{RESET} {name}: {detail}")
+
+    print(f"\n{'=' * 60}")
+    print(f"Streaming Test Results: {len(results) - failed}/{len(results)} passed")
+    if failed:
+        print(f"\n{RED}Some tests failed!{RESET}")
+    else:
+        print(f"\n{GREEN}All streaming tests passed!{RESET}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,25 @@
 Philosopher Plugin Test Runner
 
 Validates plugin structure, hooks, agents, and skills.
-Run with: python3 tests/test-runner.py
+Run with: python3 tests/test-runner.py [--quiet]
 """
 
+import ast
+import io
 import os
+import re
 import sys
 import json
-import subprocess
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Any, Dict, List, Set, Tuple, Optional
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to stdlib json
+    orjson = None
+
+# Reused across calls instead of the per-call default behind json.load
+_DECODER = json.JSONDecoder()
 
 # Colors for output
 GREEN = "\033[92m"
@@ -21,54 +31,198 @@ RESET = "\033[0m"
 
 
 class TestResult:
-    """Container for test results."""
+    """Container for test results.
 
-    def __init__(self):
+    Report lines are buffered and written in one go by flush(); with quiet
+    only the summary is shown.
+    """
+
+    def __init__(self, quiet: bool = False):
         self.passed: List[str] = []
         self.failed: List[Tuple[str, str]] = []
         self.warnings: List[str] = []
+        self.quiet = quiet
+        self.buf = io.StringIO()
+
+    def log(self, line: str):
+        self.buf.write(line + "\n")
+
+    def flush(self):
+        """Write buffered report lines to stdout."""
+        if not self.quiet:
+            sys.stdout.write(self.buf.getvalue())
+        self.buf = io.StringIO()
 
     def add_pass(self, name: str):
         self.passed.append(name)
-        print(f"  {GREEN}[PASS]{RESET} {name}")
+        self.log(f"  {GREEN}[PASS]{RESET} {name}")
 
     def add_fail(self, name: str, reason: str):
         self.failed.append((name, reason))
-        print(f"  {RED}[FAIL]{RESET} {name}: {reason}")
+        self.log(f"  {RED}[FAIL]{RESET} {name}: {reason}")
 
     def add_warning(self, msg: str):
         self.warnings.append(msg)
-        print(f"  {YELLOW}[WARN]{RESET} {msg}")
+        self.log(f"  {YELLOW}[WARN]{RESET} {msg}")
 
     def summary(self) -> bool:
         """Print summary and return True if all tests passed."""
         total = len(self.passed) + len(self.failed)
-        print(f"\n{'='*60}")
-        print(f"Test Results: {len(self.passed)}/{total} passed")
+        lines = [f"\n{'='*60}", f"Test Results: {len(self.passed)}/{total} passed"]
 
         if self.warnings:
-            print(f"Warnings: {len(self.warnings)}")
+            lines.append(f"Warnings: {len(self.warnings)}")
 
         if self.failed:
-            print(f"\n{RED}Failed Tests:{RESET}")
+            lines.append(f"\n{RED}Failed Tests:{RESET}")
             for name, reason in self.failed:
-                print(f"  - {name}: {reason}")
-            return False
+                lines.append(f"  - {name}: {reason}")
+        else:
+            lines.append(f"\n{GREEN}All tests passed!{RESET}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        return not self.failed
+
+
+# Plugin root (this file lives in tests/), resolved once for every test
+PLUGIN_ROOT = Path(__file__).resolve().parent.parent
+
+
+class FileIndex:
+    """Repo-relative paths of the plugin's files and directories.
+
+    Built from one os.scandir walk so the many existence checks below are
+    set lookups instead of a stat call each. Paths deeper than max_depth or
+    inside SKIP_DIRS aren't indexed and fall back to the filesystem.
+    """
+
+    SKIP_DIRS = frozenset({".git", "__pycache__"})
+
+    def __init__(self, root: Path, max_depth: int = 3):
+        self.root = root
+        self.max_depth = max_depth
+        self.files: Set[str] = set()
+        self.dirs: Set[str] = set()
+        self._walk(str(root), "", 1)
+
+    def _walk(self, path: str, prefix: str, depth: int):
+        with os.scandir(path) as entries:
+            for entry in entries:
+                rel = prefix + entry.name
+                if entry.is_dir():
+                    self.dirs.add(rel)
+                    if depth < self.max_depth and entry.name not in self.SKIP_DIRS:
+                        self._walk(entry.path, rel + os.sep, depth + 1)
+                elif entry.is_file():
+                    self.files.add(rel)
+
+    def _indexed(self, key: str) -> bool:
+        return not (
+            os.path.isabs(key)
+            or key == os.pardir
+            or key.startswith(os.pardir + os.sep)
+            or key.count(os.sep) >= self.max_depth
+            or key.split(os.sep, 1)[0] in self.SKIP_DIRS
+        )
+
+    def exists(self, rel_path: str) -> bool:
+        key = os.path.normpath(rel_path)
+        if not self._indexed(key):
+            return (self.root / key).exists()
+        return key in self.files or key in self.dirs
+
+    def is_dir(self, rel_path: str) -> bool:
+        key = os.path.normpath(rel_path)
+        if not self._indexed(key):
+            return (self.root / key).is_dir()
+        return key in self.dirs
+
+
+# Agent frontmatter is looked for in this first block (read on if unclosed)
+FRONTMATTER_READ_SIZE = 4096
+
+# A SKILL.md longer than this many characters counts as substantial
+MIN_SKILL_CHARS = 100
+
+# First whitespace-delimited token of a hook command that names a .py file
+_PY_SCRIPT_RE = re.compile(r"(?<!\S)(\S*\.py)(?!\S)")
+
+# Top-level fields plugin.json and marketplace.json must both declare
+MANIFEST_REQUIRED_FIELDS = ("name", "version", "description")
+
+# Attribute calls counted as JSON output: json.dump(s), orjson.dumps, ...
+JSON_WRITERS = frozenset({"dump", "dumps"})
+
+
+def find_output_calls(tree: ast.AST) -> Tuple[bool, bool]:
+    """Return (writes JSON, calls print) for a parsed module."""
+    writes_json = calls_print = False
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            func = node.func
+            if isinstance(func, ast.Attribute) and func.attr in JSON_WRITERS:
+                writes_json = True
+            elif isinstance(func, ast.Name) and func.id == "print":
+                calls_print = True
+    return writes_json, calls_print
+
+
+def check_required_fields(result: TestResult, filename: str, manifest: Any):
+    """Report each MANIFEST_REQUIRED_FIELDS entry as present or missing."""
+    missing = set(MANIFEST_REQUIRED_FIELDS).difference(manifest)
+    for field in MANIFEST_REQUIRED_FIELDS:
+        if field in missing:
+            result.add_fail(f"{filename} has '{field}' field", "Missing field")
+        else:
+            result.add_pass(f"{filename} has '{field}' field")
+
 
-        print(f"\n{GREEN}All tests passed!{RESET}")
-        return True
+def named_entries(entries: List[Any]) -> List[Dict[str, Any]]:
+    """The entries of an agents/skills array that carry both name and path."""
+    return [e for e in entries if isinstance(e, dict) and "name" in e and "path" in e]
 
 
-def get_plugin_root() -> Path:
-    """Get the plugin root directory."""
-    # Assuming test-runner.py is in tests/
-    return Path(__file__).parent.parent
+def scan_dir(path: Path, suffix: str = "", dirs: bool = False) -> List[os.DirEntry]:
+    """Entries of path ending in suffix: directories if dirs, else files.
 
+    DirEntry caches the type from the directory listing, so filtering costs
+    no extra stat call per entry.
+    """
+    with os.scandir(path) as entries:
+        return [
+            entry for entry in entries
+            if entry.name.endswith(suffix) and (entry.is_dir() if dirs else entry.is_file())
+        ]
 
-def test_plugin_structure(result: TestResult):
+
+def check_hook_script(py_file: os.DirEntry) -> Tuple[Optional[str], bool, bool]:
+    """Read and parse one hook; return (syntax error, writes JSON, calls print).
+
+    The source stays bytes: ast.parse decodes it itself (honouring any coding
+    cookie), and a hook with neither "dump" nor "print" in it needs no walk.
+    """
+    with open(py_file.path, "rb") as f:
+        code = f.read()
+    try:
+        tree = ast.parse(code, filename=py_file.name)
+    except SyntaxError as e:
+        return str(e), False, False
+    if b"dump" not in code and b"print" not in code:
+        return None, False, False
+    return (None,) + find_output_calls(tree)
+
+
+def load_json(path: Path) -> Any:
+    """Read and parse a JSON file (orjson when available)."""
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return _DECODER.decode(data.decode("utf-8"))
+
+
+def test_plugin_structure(result: TestResult, files: FileIndex):
     """Test basic plugin structure."""
-    print("\n[Structure Tests]")
-    root = get_plugin_root()
+    result.log("\n[Structure Tests]")
 
     # Required files
     required_files = [
@@ -78,7 +232,7 @@ def test_plugin_structure(result: TestResult):
     ]
 
     for file_path, desc in required_files:
-        if (root / file_path).exists():
+        if files.exists(file_path):
             result.add_pass(f"{desc} exists")
         else:
             result.add_fail(f"{desc} exists", f"Missing {file_path}")
@@ -91,21 +245,20 @@ def test_plugin_structure(result: TestResult):
     ]
 
     for dir_path, desc in required_dirs:
-        if (root / dir_path).is_dir():
+        if files.is_dir(dir_path):
             result.add_pass(f"{desc} exists")
         else:
             result.add_fail(f"{desc} exists", f"Missing {dir_path}/")
 
 
-def test_plugin_json(result: TestResult):
+def test_plugin_json(result: TestResult, files: FileIndex):
     """Test plugin.json validity."""
-    print("\n[plugin.json Tests]")
-    root = get_plugin_root()
+    result.log("\n[plugin.json Tests]")
+    root = PLUGIN_ROOT
     plugin_path = root / "plugin.json"
 
     try:
-        with open(plugin_path) as f:
-            plugin = json.load(f)
+        plugin = load_json(plugin_path)
         result.add_pass("plugin.json is valid JSON")
     except json.JSONDecodeError as e:
         result.add_fail("plugin.json is valid JSON", str(e))
@@ -115,59 +268,43 @@ def test_plugin_json(result: TestResult):
         return
 
     # Required fields
-    required_fields = ["name", "version", "description"]
-    for field in required_fields:
-        if field in plugin:
-            result.add_pass(f"plugin.json has '{field}' field")
-        else:
-            result.add_fail(f"plugin.json has '{field}' field", "Missing field")
+    check_required_fields(result, "plugin.json", plugin)
 
-    # Check agents array
+    # Check agents array: each agent file exists
     if "agents" in plugin:
         result.add_pass("plugin.json has 'agents' array")
-        for agent in plugin["agents"]:
-            if isinstance(agent, dict):
-                if "name" in agent and "path" in agent:
-                    # Check agent file exists
-                    agent_path = root / agent["path"]
-                    if agent_path.exists():
-                        result.add_pass(f"Agent '{agent['name']}' file exists")
-                    else:
-                        result.add_fail(f"Agent '{agent['name']}' file exists", f"Missing {agent['path']}")
-
-    # Check skills array
+        for agent in named_entries(plugin["agents"]):
+            if files.exists(agent["path"]):
+                result.add_pass(f"Agent '{agent['name']}' file exists")
+            else:
+                result.add_fail(f"Agent '{agent['name']}' file exists", f"Missing {agent['path']}")
+
+    # Check skills array: each skill directory exists and has a SKILL.md
     if "skills" in plugin:
         result.add_pass("plugin.json has 'skills' array")
-        for skill in plugin["skills"]:
-            if isinstance(skill, dict):
-                if "name" in skill and "path" in skill:
-                    # Check skill directory exists
-                    skill_path = root / skill["path"]
-                    if skill_path.is_dir():
-                        result.add_pass(f"Skill '{skill['name']}' directory exists")
-                        # Check SKILL.md
-                        skill_md = skill_path / "SKILL.md"
-                        if skill_md.exists():
-                            result.add_pass(f"Skill '{skill['name']}' has SKILL.md")
-                        else:
-                            result.add_fail(f"Skill '{skill['name']}' has SKILL.md", "Missing SKILL.md")
-                    else:
-                        result.add_fail(f"Skill '{skill['name']}' directory exists", f"Missing {skill['path']}/")
+        for skill in named_entries(plugin["skills"]):
+            if files.is_dir(skill["path"]):
+                result.add_pass(f"Skill '{skill['name']}' directory exists")
+                if files.exists(os.path.join(skill["path"], "SKILL.md")):
+                    result.add_pass(f"Skill '{skill['name']}' has SKILL.md")
+                else:
+                    result.add_fail(f"Skill '{skill['name']}' has SKILL.md", "Missing SKILL.md")
+            else:
+                result.add_fail(f"Skill '{skill['name']}' directory exists", f"Missing {skill['path']}/")
 
 
-def test_hooks_json(result: TestResult):
+def test_hooks_json(result: TestResult, files: FileIndex):
     """Test hooks.json validity."""
-    print("\n[hooks.json Tests]")
-    root = get_plugin_root()
+    result.log("\n[hooks.json Tests]")
+    root = PLUGIN_ROOT
     hooks_path = root / "hooks" / "hooks.json"
 
-    if not hooks_path.exists():
+    if not files.exists(os.path.join("hooks", "hooks.json")):
         result.add_warning("No hooks.json found (optional)")
         return
 
     try:
-        with open(hooks_path) as f:
-            hooks_config = json.load(f)
+        hooks_config = load_json(hooks_path)
         result.add_pass("hooks.json is valid JSON")
     except json.JSONDecodeError as e:
         result.add_fail("hooks.json is valid JSON", str(e))
@@ -197,74 +334,71 @@ def test_hooks_json(result: TestResult):
                 if ih.get("type") == "command":
                     cmd = ih.get("command", "")
                     # Extract Python file from command
-                    if ".py" in cmd:
-                        parts = cmd.split()
-                        for part in parts:
-                            if part.endswith(".py"):
-                                py_file = root / part
-                                if py_file.exists():
-                                    result.add_pass(f"Hook script '{part}' exists")
-                                else:
-                                    result.add_fail(f"Hook script '{part}' exists", "File not found")
-                                break
-
-
-def test_hook_scripts(result: TestResult):
+                    match = _PY_SCRIPT_RE.search(cmd)
+                    if match:
+                        part = match.group(1)
+                        if files.exists(part):
+                            result.add_pass(f"Hook script '{part}' exists")
+                        else:
+                            result.add_fail(f"Hook script '{part}' exists", "File not found")
+
+
+def test_hook_scripts(result: TestResult, files: FileIndex):
     """Test hook Python scripts for basic validity."""
-    print("\n[Hook Script Tests]")
-    root = get_plugin_root()
+    result.log("\n[Hook Script Tests]")
+    root = PLUGIN_ROOT
     hooks_dir = root / "hooks"
 
-    if not hooks_dir.exists():
+    if not files.exists("hooks"):
         result.add_warning("No hooks directory found")
         return
 
-    for py_file in hooks_dir.glob("*.py"):
-        if py_file.name == "__init__.py":
-            continue
+    py_files = [e for e in scan_dir(hooks_dir, ".py") if e.name != "__init__.py"]
 
+    for py_file in py_files:
+        error, writes_json, calls_print = check_hook_script(py_file)
         # Check syntax validity
-        try:
-            with open(py_file) as f:
-                code = f.read()
-            compile(code, py_file.name, "exec")
-            result.add_pass(f"Hook '{py_file.name}' has valid Python syntax")
-        except SyntaxError as e:
-            result.add_fail(f"Hook '{py_file.name}' has valid Python syntax", str(e))
+        if error is not None:
+            result.add_fail(f"Hook '{py_file.name}' has valid Python syntax", error)
             continue
+        result.add_pass(f"Hook '{py_file.name}' has valid Python syntax")
 
-        # Check for required patterns
-        if "json.dumps" in code or "json.dump" in code:
+        # Check for output calls (ignores mentions in comments and strings)
+        if writes_json:
             result.add_pass(f"Hook '{py_file.name}' outputs JSON")
-        elif "print(" in code:
+        elif calls_print:
             result.add_pass(f"Hook '{py_file.name}' has output")
         else:
             result.add_warning(f"Hook '{py_file.name}' may not produce output")
 
 
-def test_agents(result: TestResult):
+def test_agents(result: TestResult, files: FileIndex):
     """Test agent markdown files."""
-    print("\n[Agent Tests]")
-    root = get_plugin_root()
+    result.log("\n[Agent Tests]")
+    root = PLUGIN_ROOT
     agents_dir = root / "agents"
 
-    if not agents_dir.exists():
+    if not files.exists("agents"):
         result.add_fail("Agents directory exists", "Missing agents/")
         return
 
-    for agent_file in agents_dir.glob("*.md"):
-        with open(agent_file) as f:
-            content = f.read()
+    for agent_file in scan_dir(agents_dir, ".md"):
+        # Only the frontmatter matters, so don't read the whole body
+        with open(agent_file.path, "rb") as f:
+            content = f.read(FRONTMATTER_READ_SIZE)
+            if content.startswith(b"---") and content.find(b"---", 3) == -1:
+                content += f.read()
 
         # Check for YAML frontmatter
-        if content.startswith("---"):
-            end_idx = content[3:].find("---")
-            if end_idx > 0:
+        if content.startswith(b"---"):
+            # Search past the opening marker in place instead of slicing a copy
+            end_idx = content.find(b"---", 3)
+            if end_idx > 3:
                 result.add_pass(f"Agent '{agent_file.name}' has YAML frontmatter")
 
                 # Parse frontmatter
-                frontmatter = content[3:end_idx+3]
-                if "name:" in frontmatter:
+                frontmatter = content[3:end_idx]
+                if b"name:" in frontmatter:
                     result.add_pass(f"Agent '{agent_file.name}' has name field")
                 else:
                     result.add_fail(f"Agent '{agent_file.name}' has name field", "Missing name")
@@ -274,29 +408,27 @@ def test_agents(result: TestResult):
             result.add_fail(f"Agent '{agent_file.name}' has YAML frontmatter", "No frontmatter found")
 
 
-def test_skills(result: TestResult):
+def test_skills(result: TestResult, files: FileIndex):
     """Test skill directories."""
-    print("\n[Skill Tests]")
-    root = get_plugin_root()
+    result.log("\n[Skill Tests]")
+    root = PLUGIN_ROOT
     skills_dir = root / "skills"
 
-    if not skills_dir.exists():
+    if not files.exists("skills"):
         result.add_fail("Skills directory exists", "Missing skills/")
         return
 
-    for skill_dir in skills_dir.iterdir():
-        if not skill_dir.is_dir():
-            continue
-
-        skill_md = skill_dir / "SKILL.md"
-        if skill_md.exists():
+    for skill_dir in scan_dir(skills_dir, dirs=True):
+        skill_md = os.path.join(skill_dir.path, "SKILL.md")
+        if files.exists(os.path.join("skills", skill_dir.name, "SKILL.md")):
             result.add_pass(f"Skill '{skill_dir.name}' has SKILL.md")
 
-            with open(skill_md) as f:
-                content = f.read()
-
-            # Check content quality
-            if len(content) > 100:
+            # Check content quality; a UTF-8 character is at most 4 bytes, so
+            # the file size alone decides unless it is borderline
+            size = os.stat(skill_md).st_size
+            if size > 4 * MIN_SKILL_CHARS or (
+                size > MIN_SKILL_CHARS and len(Path(skill_md).read_text()) > MIN_SKILL_CHARS
+            ):
                 result.add_pass(f"Skill '{skill_dir.name}' has substantial content")
             else:
                 result.add_warning(f"Skill '{skill_dir.name}' has minimal content")
@@ -304,49 +436,46 @@ def test_skills(result: TestResult):
             result.add_fail(f"Skill '{skill_dir.name}' has SKILL.md", "Missing SKILL.md")
 
 
-def test_marketplace_json(result: TestResult):
+def test_marketplace_json(result: TestResult, files: FileIndex):
     """Test marketplace.json validity."""
-    print("\n[marketplace.json Tests]")
-    root = get_plugin_root()
+    result.log("\n[marketplace.json Tests]")
+    root = PLUGIN_ROOT
     marketplace_path = root / ".claude-plugin" / "marketplace.json"
 
-    if not marketplace_path.exists():
+    if not files.exists(os.path.join(".claude-plugin", "marketplace.json")):
         result.add_fail("marketplace.json exists", "Missing .claude-plugin/marketplace.json")
         return
 
     try:
-        with open(marketplace_path) as f:
-            marketplace = json.load(f)
+        marketplace = load_json(marketplace_path)
         result.add_pass("marketplace.json is valid JSON")
     except json.JSONDecodeError as e:
         result.add_fail("marketplace.json is valid JSON", str(e))
         return
 
     # Check required fields
-    required_fields = ["name", "version", "description"]
-    for field in required_fields:
-        if field in marketplace:
-            result.add_pass(f"marketplace.json has '{field}' field")
-        else:
-            result.add_fail(f"marketplace.json has '{field}' field", "Missing field")
+    check_required_fields(result, "marketplace.json", marketplace)
 
 
 def main():
     """Run all tests."""
-    print("="*60)
-    print("Philosopher Plugin Test Runner")
-    print("="*60)
-
-    result = TestResult()
-
-    # Run all test suites
-    test_plugin_structure(result)
-    test_plugin_json(result)
-    test_hooks_json(result)
-    test_hook_scripts(result)
-    test_agents(result)
-    test_skills(result)
-    test_marketplace_json(result)
+    result = TestResult(quiet="--quiet" in sys.argv[1:])
+    result.log("="*60)
+    result.log("Philosopher Plugin Test Runner")
+    result.log("="*60)
+    files = FileIndex(PLUGIN_ROOT)
+
+    # Run all test suites; the report is written even if one crashes
+    try:
+        test_plugin_structure(result, files)
+        test_plugin_json(result, files)
+        test_hooks_json(result, files)
+        test_hook_scripts(result, files)
+        test_agents(result, files)
+        test_skills(result, files)
+        test_marketplace_json(result, files)
+    finally:
+        result.flush()
 
     # Print summary
     success = result.summary()